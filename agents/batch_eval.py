@@ -0,0 +1,122 @@
+import numpy as np
+
+from agents.bitboard import BOARD_SIZE, STRIDE, BitBoard
+from agents.evaluation import SCORE_TABLE
+
+EMPTY = 0
+PLAYER_X = 1
+PLAYER_O = 2
+
+# ==============================
+# GEOMETRY
+# ==============================
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+PAD = 6     # cukup untuk melihat 5 sel run + 1 sel sesudahnya
+
+
+def _direction_mask(dr, dc):
+    # Sel pada garis dengan panjang >= 5 (sama dengan filter di evaluate_board)
+    mask = np.zeros((BOARD_SIZE, BOARD_SIZE), dtype=bool)
+    for r in range(BOARD_SIZE):
+        for c in range(BOARD_SIZE):
+            length = 1
+            for sign in (1, -1):
+                nr, nc = r + sign * dr, c + sign * dc
+                while 0 <= nr < BOARD_SIZE and 0 <= nc < BOARD_SIZE:
+                    length += 1
+                    nr, nc = nr + sign * dr, nc + sign * dc
+            mask[r, c] = length >= 5
+    return mask
+
+
+DIRECTION_MASKS = [_direction_mask(dr, dc) for dr, dc in DIRECTIONS]
+
+# RUN_SCORES[k, open_ends] dari SCORE_TABLE, k = 1..5
+RUN_SCORES = np.array(
+    [[SCORE_TABLE.get((k, ends), 0) for ends in range(3)] for k in range(6)], dtype=np.int64
+)
+
+
+# ==============================
+# CONVERSION
+# ==============================
+def bitboard_to_array(board):
+    out = np.zeros((BOARD_SIZE, BOARD_SIZE), dtype=np.int8)
+    num_bytes = (BOARD_SIZE * STRIDE + 7) // 8
+    for player, bits in ((PLAYER_X, board.x_bits), (PLAYER_O, board.o_bits)):
+        flat = np.unpackbits(
+            np.frombuffer(bits.to_bytes(num_bytes, "little"), dtype=np.uint8), bitorder="little"
+        )[: BOARD_SIZE * STRIDE]
+        out[flat.reshape(BOARD_SIZE, STRIDE)[:, :BOARD_SIZE].astype(bool)] = player
+    return out
+
+
+def stack_boards(boards):
+    """Ubah list BitBoard / list 2D menjadi array (N, 15, 15) int8."""
+    return np.stack([
+        bitboard_to_array(b) if isinstance(b, BitBoard) else np.asarray(b, dtype=np.int8)
+        for b in boards
+    ])
+
+
+# ==============================
+# BATCH EVALUATION
+# ==============================
+def _shifted(padded, dr, dc, k):
+    # View (N, 15, 15) dari sel yang berjarak k langkah searah (dr, dc)
+    r0 = PAD + dr * k
+    c0 = PAD + dc * k
+    return padded[:, r0:r0 + BOARD_SIZE, c0:c0 + BOARD_SIZE]
+
+
+def _score_runs(own, empty):
+    """Skor run untuk setiap papan; own/empty berbentuk (N, 15, 15) bool."""
+    total = np.zeros(own.shape[0], dtype=np.int64)
+    for (dr, dc), line_mask in zip(DIRECTIONS, DIRECTION_MASKS):
+        own_d = np.pad(own & line_mask, ((0, 0), (PAD, PAD), (PAD, PAD)))
+        empty_d = np.pad(empty & line_mask, ((0, 0), (PAD, PAD), (PAD, PAD)))
+        base = _shifted(own_d, dr, dc, 0)
+        starts = base & ~_shifted(own_d, dr, dc, -1)
+        before = _shifted(empty_d, dr, dc, -1)
+        run = base
+        for k in range(1, 6):
+            longer = run & _shifted(own_d, dr, dc, k)
+            exact = starts & run & ~longer
+            after = _shifted(empty_d, dr, dc, k)
+            both = before & after
+            either = before ^ after
+            s0, s1, s2 = RUN_SCORES[k]
+            total += s2 * np.count_nonzero(exact & both, axis=(1, 2))
+            total += s1 * np.count_nonzero(exact & either, axis=(1, 2))
+            if s0:
+                total += s0 * np.count_nonzero(exact & ~(before | after), axis=(1, 2))
+            run = longer
+    return total
+
+
+def evaluate_boards(boards, player, defense_weight=1.5):
+    """Evaluasi N papan sekaligus; hasil sama dengan evaluate_board per papan.
+
+    `boards` boleh berupa array (N, 15, 15) atau list BitBoard / list 2D.
+    Mengembalikan array float64 berukuran N.
+    """
+    if not isinstance(boards, np.ndarray):
+        boards = stack_boards(boards)
+    opponent = PLAYER_X if player == PLAYER_O else PLAYER_O
+    empty = boards == EMPTY
+    my_score = _score_runs(boards == player, empty)
+    op_score = _score_runs(boards == opponent, empty)
+    return my_score - (op_score * defense_weight)
+
+
+def evaluate_children(board, moves, mover, player, defense_weight=1.5):
+    """Evaluasi semua anak sebuah node (board + satu langkah `mover`) dalam satu panggilan."""
+    if not moves:
+        # Papan penuh / tidak ada kandidat
+        return np.zeros(0, dtype=np.float64)
+    base = bitboard_to_array(board) if isinstance(board, BitBoard) else np.asarray(board, dtype=np.int8)
+    children = np.repeat(base[None], len(moves), axis=0)
+    rows, cols = zip(*moves)
+    children[np.arange(len(moves)), rows, cols] = mover
+    return evaluate_boards(children, player, defense_weight)
+
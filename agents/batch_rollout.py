@@ -0,0 +1,184 @@
+import random
+from functools import lru_cache
+
+import numpy as np
+
+from agents.bitboard import BOARD_SIZE, NUM_BITS, PLAYER_X, PLAYER_O, cell_index
+
+CELLS = BOARD_SIZE * BOARD_SIZE
+OFF_BOARD = CELLS       # kolom tambahan yang selalu kosong, tujuan indeks di luar papan
+_DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+SAMPLE_TRIES = 24       # sel acak per permainan per langkah sebelum cara lengkap
+
+# Indeks datar (r * 15 + c) -> indeks bit BitBoard (r * 16 + c)
+_TO_BIT = np.array([cell_index(f // BOARD_SIZE, f % BOARD_SIZE) for f in range(CELLS)], dtype=np.intp)
+_NUM_BYTES = (NUM_BITS + 7) // 8
+
+
+# ==============================
+# TABLES
+# ==============================
+@lru_cache(maxsize=None)
+def _tables(radius):
+    """(near, lines): near[f] = mask sel dalam kotak radius dari f,
+    lines[f] = indeks 9 sel (-4..4) pada tiap arah melalui f.
+    """
+    near = np.zeros((CELLS, CELLS), dtype=bool)
+    lines = np.full((CELLS, 4, 9), OFF_BOARD, dtype=np.intp)
+    for r in range(BOARD_SIZE):
+        for c in range(BOARD_SIZE):
+            f = r * BOARD_SIZE + c
+            near[f].reshape(BOARD_SIZE, BOARD_SIZE)[
+                max(0, r - radius):r + radius + 1, max(0, c - radius):c + radius + 1] = True
+            for d, (dr, dc) in enumerate(_DIRECTIONS):
+                for k in range(-4, 5):
+                    rr, cc = r + dr * k, c + dc * k
+                    if 0 <= rr < BOARD_SIZE and 0 <= cc < BOARD_SIZE:
+                        lines[f, d, k + 4] = rr * BOARD_SIZE + cc
+    return near, lines
+
+
+def _unpack(masks):
+    # List bitmask BitBoard -> array (M, 15 * 15) berisi 0/1 dalam urutan datar
+    raw = np.frombuffer(b"".join(x.to_bytes(_NUM_BYTES, "little") for x in masks), dtype=np.uint8)
+    bits = np.unpackbits(raw.reshape(len(masks), _NUM_BYTES), axis=1, bitorder="little")
+    return bits[:, _TO_BIT].astype(np.int8)
+
+
+# ==============================
+# BATCH PLAYOUT KERNEL
+# ==============================
+def batch_playouts(jobs, max_steps, radius, moves=None, seed=None):
+    """Jalankan rollout acak untuk semua (board, mover) di `jobs` secara serentak.
+
+    Semua permainan disimpan sebagai satu array (M, 15 * 15) plus mask
+    kandidat (sel kosong dalam `radius` dari bidak); tiap langkah
+    memilih sel kandidat acak untuk semua permainan yang masih hidup,
+    memasangnya, lalu mengecek lima di sekitar langkah itu dengan operasi
+    array. Hasil per permainan sama artinya dengan RolloutEngine.run
+    (1.0 O menang, 0.0 X menang, 0.5 tidak ada pemenang). Jika `moves`
+    diberikan (list), daftar indeks bit langkah tiap rollout ditambahkan.
+    """
+    m = len(jobs)
+    if not m:
+        return []
+    near_table, lines = _tables(radius)
+    rng = np.random.default_rng(random.getrandbits(64) if seed is None else seed)
+
+    board = np.zeros((m, CELLS + 1), dtype=np.int8)
+    board[:, :CELLS] = _unpack([b.x_bits for b, _ in jobs]) * PLAYER_X
+    board[:, :CELLS] += _unpack([b.o_bits for b, _ in jobs]) * PLAYER_O
+    player = np.array([mover for _, mover in jobs], dtype=np.int8)
+    free = board[:, :CELLS] == 0
+    cand = ((~free).astype(np.float32) @ near_table.astype(np.float32)) > 0
+    # Papan kosong: mulai dari tengah
+    cand[free.all(axis=1), (BOARD_SIZE // 2) * BOARD_SIZE + BOARD_SIZE // 2] = True
+    cand &= free
+
+    results = np.full(m, 0.5)
+    live = np.arange(m)
+    played = np.full((m, max_steps), -1, dtype=np.intp)
+
+    for step in range(max_steps):
+        # Rejection sampling: SAMPLE_TRIES sel acak per permainan, ambil kandidat
+        # pertama (tetap seragam di antara kandidat). Yang tidak kena memakai
+        # cara lengkap, yang juga mendeteksi permainan tanpa kandidat.
+        n = live.size
+        rows = np.arange(n)
+        draws = rng.integers(0, CELLS, (n, SAMPLE_TRIES))
+        hit = cand[live[:, None], draws]
+        first = hit.argmax(axis=1)
+        move = draws[rows, first]
+        miss = np.flatnonzero(~hit[rows, first])
+        if miss.size:
+            exact = cand[live[miss]]
+            noise = rng.random(exact.shape)
+            noise[~exact] = -1.0
+            move[miss] = noise.argmax(axis=1)
+            stuck = miss[~exact.any(axis=1)]
+            if stuck.size:
+                keep = np.ones(n, dtype=bool)
+                keep[stuck] = False
+                live, move = live[keep], move[keep]
+                if not live.size:
+                    break
+
+        mover = player[live]
+        board[live, move] = mover
+        free[live, move] = False
+        cand[live] = (cand[live] | near_table[move]) & free[live]
+        played[live, step] = move
+
+        # Lima: ada jendela 5 sel berurutan milik mover di salah satu garis
+        same = board[live[:, None, None], lines[move]] == mover[:, None, None]
+        run = np.cumsum(same, axis=2, dtype=np.int8)
+        window = run[:, :, 4:] - np.concatenate(
+            (np.zeros((live.size, 4, 1), dtype=np.int8), run[:, :, :4]), axis=2)
+        won = (window == 5).any(axis=(1, 2))
+        results[live[won]] = np.where(mover[won] == PLAYER_O, 1.0, 0.0)
+
+        live = live[~won]
+        if not live.size:
+            break
+        player[live] = np.where(player[live] == PLAYER_X, PLAYER_O, PLAYER_X)
+
+    if moves is not None:
+        for row in played:
+            moves.append(_TO_BIT[row[row >= 0]].tolist())
+    return results.tolist()
+
+
+class BatchRolloutEngine:
+    """RolloutEngine berbasis batch_playouts; run() adalah batch berisi satu permainan."""
+
+    def __init__(self, radius):
+        self.radius = radius
+
+    def run(self, board, player, max_steps, rng=random.random, moves=None):
+        job_moves = [] if moves is not None else None
+        result = batch_playouts([(board, player)], max_steps, self.radius, job_moves)[0]
+        if moves is not None:
+            moves.extend(job_moves[0])
+        return result
+
+    def run_batch(self, jobs, max_steps, moves=None):
+        return batch_playouts(jobs, max_steps, self.radius, moves)
+
+
+# ==============================
+# THROUGHPUT BENCHMARK
+# ==============================
+def benchmark_batch_sizes(board, max_steps=30, radius=1, batch_sizes=(16, 64, 256, 1024), seconds=1.0):
+    """Rollout per detik kernel array untuk tiap ukuran batch, plus RolloutEngine sebagai pembanding."""
+    import time
+
+    from agents.rollout import get_rollout_engine
+
+    player = board.side_to_move()
+    rows = []
+    engine = get_rollout_engine(radius)
+    start = time.perf_counter()
+    done = 0
+    while time.perf_counter() - start < seconds:
+        engine.run(board, player, max_steps)
+        done += 1
+    rows.append(("python", done / (time.perf_counter() - start)))
+    for size in batch_sizes:
+        jobs = [(board, player)] * size
+        start = time.perf_counter()
+        done = 0
+        while time.perf_counter() - start < seconds:
+            batch_playouts(jobs, max_steps, radius)
+            done += size
+        rows.append((size, done / (time.perf_counter() - start)))
+    return rows
+
+
+if __name__ == "__main__":
+    from agents.mcts_benchmark import random_positions
+
+    bench_board = random_positions(1, stones=12)[0]
+
+    print(f"{'batch':>8} {'rollouts/s':>10}")
+    for size, rate in benchmark_batch_sizes(bench_board):
+        print(f"{size:>8} {rate:>10.0f}")
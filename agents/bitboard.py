@@ -0,0 +1,250 @@
+import random
+
+EMPTY = 0
+PLAYER_X = 1
+PLAYER_O = 2
+
+# ==============================
+# GEOMETRY
+# ==============================
+# Setiap baris memakai STRIDE bit: 15 sel + 1 kolom penjaga yang selalu 0,
+# sehingga shift horizontal/diagonal tidak pernah "bocor" ke baris lain.
+BOARD_SIZE = 15
+STRIDE = BOARD_SIZE + 1
+NUM_BITS = BOARD_SIZE * STRIDE
+CENTER = (BOARD_SIZE // 2, BOARD_SIZE // 2)
+
+
+def cell_index(r, c):
+    return r * STRIDE + c
+
+
+def index_cell(idx):
+    return divmod(idx, STRIDE)
+
+
+BOARD_MASK = 0
+for _r in range(BOARD_SIZE):
+    BOARD_MASK |= ((1 << BOARD_SIZE) - 1) << (_r * STRIDE)
+
+# Shift untuk arah horizontal, vertikal, diagonal \ dan diagonal /
+SHIFTS = (1, STRIDE, STRIDE + 1, STRIDE - 1)
+
+
+def _line_mask(dr, dc):
+    # Sel yang berada pada garis (arah dr, dc) dengan panjang >= 5
+    mask = 0
+    for r in range(BOARD_SIZE):
+        for c in range(BOARD_SIZE):
+            length = 1
+            for sign in (1, -1):
+                nr, nc = r + sign * dr, c + sign * dc
+                while 0 <= nr < BOARD_SIZE and 0 <= nc < BOARD_SIZE:
+                    length += 1
+                    nr, nc = nr + sign * dr, nc + sign * dc
+            if length >= 5:
+                mask |= 1 << cell_index(r, c)
+    return mask
+
+
+LINE_MASKS = tuple(_line_mask(dr, dc) for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)))
+
+
+def iter_indices(mask):
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+# Tabel (posisi byte, nilai byte) -> tuple sel (r, c), untuk mengubah mask menjadi
+# daftar langkah per 8 bit sekaligus, bukan per bit.
+_NUM_BYTES = (NUM_BITS + 7) // 8
+_BYTE_CELLS = [
+    [tuple(index_cell(pos * 8 + i) for i in range(8) if value >> i & 1) for value in range(256)]
+    for pos in range(_NUM_BYTES)
+]
+
+
+def mask_cells(mask):
+    cells = []
+    for pos, value in enumerate(mask.to_bytes(_NUM_BYTES, "little")):
+        if value:
+            cells += _BYTE_CELLS[pos][value]
+    return cells
+
+
+def dilate(mask, radius):
+    """Perluas mask sejauh `radius` sel ke segala arah (kotak Chebyshev)."""
+    for _ in range(radius):
+        mask |= ((mask << 1) | (mask >> 1)) & BOARD_MASK
+    for _ in range(radius):
+        mask |= ((mask << STRIDE) | (mask >> STRIDE)) & BOARD_MASK
+    return mask
+
+
+def has_five_bits(bits):
+    for s in SHIFTS:
+        m = bits & (bits >> s)
+        m &= m >> (2 * s)
+        if m & (bits >> (4 * s)):
+            return True
+    return False
+
+
+# ==============================
+# ZOBRIST
+# ==============================
+# Seed tetap supaya key sama di setiap proses (penting untuk worker paralel)
+_zobrist_rng = random.Random(0x5EED_600D)
+ZOBRIST = [
+    [0] * NUM_BITS,
+    [_zobrist_rng.getrandbits(64) for _ in range(NUM_BITS)],
+    [_zobrist_rng.getrandbits(64) for _ in range(NUM_BITS)],
+]
+# Di-XOR saat giliran pihak kedua, supaya posisi sama dengan giliran beda tidak bertabrakan
+SIDE_KEY = _zobrist_rng.getrandbits(64)
+
+
+# ==============================
+# BITBOARD
+# ==============================
+class BitBoard:
+    """Papan 15x15 dengan satu integer bitboard per pemain."""
+
+    __slots__ = ("x_bits", "o_bits", "count", "key")
+
+    def __init__(self, x_bits=0, o_bits=0, count=None, key=None):
+        self.x_bits = x_bits
+        self.o_bits = o_bits
+        if count is None:
+            count = x_bits.bit_count() + o_bits.bit_count()
+        self.count = count
+        if key is None:
+            key = 0
+            for idx in iter_indices(x_bits):
+                key ^= ZOBRIST[PLAYER_X][idx]
+            for idx in iter_indices(o_bits):
+                key ^= ZOBRIST[PLAYER_O][idx]
+        self.key = key
+
+    @classmethod
+    def from_grid(cls, grid):
+        if len(grid) != BOARD_SIZE:
+            raise ValueError(f"Board must be {BOARD_SIZE}x{BOARD_SIZE}, got {len(grid)} rows")
+        x_bits = o_bits = 0
+        for r, row in enumerate(grid):
+            for c, cell in enumerate(row):
+                if cell == PLAYER_X:
+                    x_bits |= 1 << cell_index(r, c)
+                elif cell == PLAYER_O:
+                    o_bits |= 1 << cell_index(r, c)
+        return cls(x_bits, o_bits)
+
+    def to_grid(self):
+        grid = [[EMPTY] * BOARD_SIZE for _ in range(BOARD_SIZE)]
+        for idx in iter_indices(self.x_bits):
+            r, c = index_cell(idx)
+            grid[r][c] = PLAYER_X
+        for idx in iter_indices(self.o_bits):
+            r, c = index_cell(idx)
+            grid[r][c] = PLAYER_O
+        return grid
+
+    def copy(self):
+        return BitBoard(self.x_bits, self.o_bits, self.count, self.key)
+
+    def bits(self, player):
+        return self.x_bits if player == PLAYER_X else self.o_bits
+
+    @property
+    def occupied(self):
+        return self.x_bits | self.o_bits
+
+    @property
+    def empty(self):
+        return BOARD_MASK & ~(self.x_bits | self.o_bits)
+
+    def get(self, r, c):
+        bit = 1 << cell_index(r, c)
+        if self.x_bits & bit:
+            return PLAYER_X
+        if self.o_bits & bit:
+            return PLAYER_O
+        return EMPTY
+
+    def is_empty(self, r, c):
+        return not (self.x_bits | self.o_bits) >> cell_index(r, c) & 1
+
+    def place(self, r, c, player):
+        idx = cell_index(r, c)
+        if player == PLAYER_X:
+            self.x_bits |= 1 << idx
+        else:
+            self.o_bits |= 1 << idx
+        self.count += 1
+        self.key ^= ZOBRIST[player][idx]
+
+    def remove(self, r, c):
+        idx = cell_index(r, c)
+        bit = 1 << idx
+        if self.x_bits & bit:
+            self.x_bits ^= bit
+            self.key ^= ZOBRIST[PLAYER_X][idx]
+        elif self.o_bits & bit:
+            self.o_bits ^= bit
+            self.key ^= ZOBRIST[PLAYER_O][idx]
+        else:
+            return
+        self.count -= 1
+
+    def side_to_move(self):
+        return PLAYER_X if self.x_bits.bit_count() == self.o_bits.bit_count() else PLAYER_O
+
+    def is_full(self):
+        return self.count >= BOARD_SIZE * BOARD_SIZE
+
+    def has_five(self, player):
+        return has_five_bits(self.bits(player))
+
+    def wins_at(self, r, c, player):
+        """Cek lima berderet hanya di empat garis yang melewati (r, c)."""
+        bits = self.bits(player)
+        idx = cell_index(r, c)
+        for s in SHIFTS:
+            count = 1
+            i = idx + s
+            while count < 5 and bits >> i & 1:
+                count += 1
+                i += s
+            i = idx - s
+            while count < 5 and i >= 0 and bits >> i & 1:
+                count += 1
+                i -= s
+            if count >= 5:
+                return True
+        return False
+
+    def neighbourhood(self, radius):
+        """Mask sel kosong dalam jarak `radius` dari bidak mana pun."""
+        occ = self.x_bits | self.o_bits
+        return dilate(occ, radius) & ~occ
+
+    def candidate_moves(self, radius):
+        if not self.count:
+            return [CENTER]
+        return mask_cells(self.neighbourhood(radius))
+
+    def __eq__(self, other):
+        return (isinstance(other, BitBoard)
+                and self.x_bits == other.x_bits and self.o_bits == other.o_bits)
+
+    def __hash__(self):
+        return self.key
+
+
+def as_bitboard(board):
+    """Terima BitBoard atau list 2D; selalu kembalikan BitBoard baru."""
+    if isinstance(board, BitBoard):
+        return board.copy()
+    return BitBoard.from_grid(board)
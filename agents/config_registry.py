@@ -0,0 +1,205 @@
+import json
+import os
+import time
+import warnings
+from collections import namedtuple
+from types import MappingProxyType
+
+CONFIG_DIR = os.path.join(os.path.dirname(__file__), "config")
+AGENT_CONFIG_PATH = os.path.join(CONFIG_DIR, "agent_config.json")
+GUI_CONFIG_PATH = os.path.join(CONFIG_DIR, "gui_config.json")
+
+CHECK_INTERVAL = 1.0    # detik minimum antar pengecekan mtime file
+
+
+class ConfigError(ValueError):
+    """Isi file konfigurasi tidak sesuai schema."""
+
+
+# ==============================
+# SCHEMA
+# ==============================
+Field = namedtuple("Field", "types required choices minimum", defaults=(False, None, None))
+
+_INT = (int,)
+_NUMBER = (int, float)
+
+MINIMAX_LEVEL_SCHEMA = {
+    "depth": Field(_INT, minimum=1),            # wajib jika tidak ada time_ms
+    "radius": Field(_INT, True, minimum=1),
+    "defense_weight": Field(_NUMBER, True, minimum=0),
+    "time_ms": Field(_NUMBER, minimum=1),
+    "threat_nodes": Field(_INT, minimum=0),
+    "workers": Field(_INT, minimum=1),
+    "search": Field((str,), choices=("alphabeta", "pvs")),
+}
+
+MCTS_LEVEL_SCHEMA = {
+    "num_simulations": Field(_INT, True, minimum=1),
+    "uct_c": Field(_NUMBER, True, minimum=0),
+    "neighbor_radius": Field(_INT, True, minimum=1),
+    "rollout_radius": Field(_INT, True, minimum=1),
+    "max_rollout_steps": Field(_INT, True, minimum=0),
+    "rollout_policy": Field((str,), choices=("random", "pattern", "numpy")),
+    "threat_nodes": Field(_INT, minimum=0),
+    "threat_time_ms": Field(_NUMBER, minimum=1),
+    "time_ms": Field(_NUMBER, minimum=1),
+    "early_stop": Field((bool,)),
+    "tree_capacity": Field(_INT, minimum=450),
+    "workers": Field(_INT, minimum=1),
+    "batch_size": Field(_INT, minimum=1),
+    "virtual_loss": Field(_NUMBER, minimum=0),
+    "rollout_workers": Field(_INT, minimum=1),
+    "rave": Field((bool,)),
+    "rave_schedule": Field((str,), choices=("equivalence", "mse")),
+    "rave_k": Field(_NUMBER, minimum=1),
+    "rave_bias": Field(_NUMBER, minimum=0),
+    "widening": Field((bool,)),
+    "widening_k": Field(_NUMBER, minimum=1),
+    "widening_alpha": Field(_NUMBER, minimum=0),
+    "puct_c": Field(_NUMBER, minimum=0),
+    "solver": Field((bool,)),
+}
+
+GUI_PLAYER_SCHEMA = {
+    "agent": Field((str,), True, choices=("minimax", "mcts")),
+    "level": Field(_INT, True, minimum=1),
+}
+
+GUI_SIMULATION_SCHEMA = {
+    "num_games": Field(_INT, minimum=1),
+    "verbose": Field((bool,)),
+}
+
+
+def _check_fields(where, data, schema):
+    if not isinstance(data, dict):
+        raise ConfigError(f"{where}: expected an object, got {type(data).__name__}")
+    for key in data:
+        if key not in schema:
+            raise ConfigError(f"{where}.{key}: unknown key")
+    for key, field in schema.items():
+        if key not in data:
+            if field.required:
+                raise ConfigError(f"{where}.{key}: missing")
+            continue
+        value = data[key]
+        # bool adalah subclass int, jadi harus ditolak eksplisit untuk field angka
+        if not isinstance(value, field.types) or (bool not in field.types and isinstance(value, bool)):
+            expected = "/".join(t.__name__ for t in field.types)
+            raise ConfigError(f"{where}.{key}: expected {expected}, got {type(value).__name__}")
+        if field.choices is not None and value not in field.choices:
+            raise ConfigError(f"{where}.{key}: must be one of {', '.join(field.choices)}")
+        if field.minimum is not None and value < field.minimum:
+            raise ConfigError(f"{where}.{key}: must be >= {field.minimum}")
+
+
+def validate_agent_config(data):
+    if not isinstance(data, dict):
+        raise ConfigError("agent_config: expected an object")
+    for section in ("minimax", "mcts"):
+        if not isinstance(data.get(section), dict) or not data[section]:
+            raise ConfigError(f"{section}: missing or empty")
+    for section in data:
+        if section not in ("minimax", "mcts"):
+            raise ConfigError(f"{section}: unknown section")
+
+    if "level_1" not in data["minimax"]:
+        raise ConfigError("minimax.level_1: missing (used as fallback level)")
+    for name, level in data["minimax"].items():
+        _check_fields(f"minimax.{name}", level, MINIMAX_LEVEL_SCHEMA)
+        if "depth" not in level and "time_ms" not in level:
+            raise ConfigError(f"minimax.{name}: needs depth or time_ms")
+    for name, level in data["mcts"].items():
+        _check_fields(f"mcts.{name}", level, MCTS_LEVEL_SCHEMA)
+
+
+def validate_gui_config(data):
+    if not isinstance(data, dict):
+        raise ConfigError("gui_config: expected an object")
+    for section in data:
+        if section not in ("player_x", "player_o", "simulation"):
+            raise ConfigError(f"{section}: unknown section")
+    for player in ("player_x", "player_o"):
+        _check_fields(player, data.get(player), GUI_PLAYER_SCHEMA)
+    if "simulation" in data:
+        _check_fields("simulation", data["simulation"], GUI_SIMULATION_SCHEMA)
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# ==============================
+# REGISTRY
+# ==============================
+class ConfigRegistry:
+    """Cache file konfigurasi JSON yang sudah divalidasi dan dibekukan.
+
+    File dibaca sekali, lalu hanya dibaca ulang jika mtime-nya berubah (mtime
+    dicek paling sering sekali per CHECK_INTERVAL). Jika file yang diubah
+    ternyata tidak valid, konfigurasi lama tetap dipakai dan sebuah warning
+    dikeluarkan; kesalahan pada pemuatan pertama langsung dilempar.
+    """
+
+    def __init__(self, check_interval=CHECK_INTERVAL):
+        self.check_interval = check_interval
+        self._entries = {}      # path -> [mtime_ns, data, waktu cek terakhir]
+        self.loads = 0
+
+    def get(self, path, validator):
+        entry = self._entries.get(path)
+        now = time.monotonic()
+        if entry is not None and now - entry[2] < self.check_interval:
+            return entry[1]
+
+        mtime = None
+        try:
+            mtime = os.stat(path).st_mtime_ns
+            if entry is not None and entry[0] == mtime:
+                entry[2] = now
+                return entry[1]
+            with open(path, "r") as f:
+                raw = json.load(f)
+            validator(raw)
+        except (ValueError, OSError) as exc:
+            if entry is None:
+                raise ConfigError(f"{os.path.basename(path)}: {exc}") from exc
+            warnings.warn(f"{os.path.basename(path)} not reloaded: {exc}")
+            # File hilang (mtime None): cek lagi setelah CHECK_INTERVAL
+            if mtime is not None:
+                entry[0] = mtime
+            entry[2] = now
+            return entry[1]
+
+        data = _freeze(raw)
+        self._entries[path] = [mtime, data, now]
+        self.loads += 1
+        return data
+
+    def clear(self):
+        self._entries.clear()
+
+
+REGISTRY = ConfigRegistry()
+
+
+def get_agent_config():
+    return REGISTRY.get(AGENT_CONFIG_PATH, validate_agent_config)
+
+
+def get_gui_config():
+    return REGISTRY.get(GUI_CONFIG_PATH, validate_gui_config)
+
+
+def get_minimax_level(level):
+    minimax = get_agent_config()["minimax"]
+    return minimax.get(f"level_{level}", minimax["level_1"])
+
+
+def get_mcts_level(level):
+    return get_agent_config()["mcts"][level]
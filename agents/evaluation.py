@@ -0,0 +1,307 @@
+import random
+from functools import lru_cache
+
+from agents.bitboard import (
+    BOARD_SIZE, LINE_MASKS, SHIFTS, BitBoard, cell_index, iter_indices,
+)
+from agents.pattern_table import PatternScorer
+
+EMPTY = 0
+PLAYER_X = 1
+PLAYER_O = 2
+
+# --- EVALUASI POLA / SKOR ---
+SCORE_TABLE = {
+    (5, 0): 1000000, (5, 1): 1000000, (5, 2): 1000000,  # Menang
+    (4, 2): 100000,  # Live 4
+    (4, 1): 10000,   # Dead 4
+    (3, 2): 5000,    # Live 3
+    (3, 1): 100,     # Dead 3
+    (2, 2): 50,      # Live 2
+    (2, 1): 10,      # Dead 2
+    (1, 2): 5,
+    (1, 1): 1
+}
+
+
+# --- HITUNG SKOR PER GARIS ---
+def evaluate_line(line, player):
+    score = 0
+    i = 0
+    length = len(line)
+    while i < length:
+        if line[i] == player:
+            count = 0
+            start_idx = i
+            while i < length and line[i] == player:
+                count += 1
+                i += 1
+
+            open_ends = 0
+            if start_idx > 0 and line[start_idx - 1] == EMPTY:
+                open_ends += 1
+            if i < length and line[i] == EMPTY:
+                open_ends += 1
+
+            score += SCORE_TABLE.get((count, open_ends), 0)
+        else:
+            i += 1
+    return score
+
+
+# --- HITUNG SKOR SELURUH PAPAN ---
+def evaluate_board(board, player, defense_weight=1.5):
+    n = len(board)
+    opponent = PLAYER_X if player == PLAYER_O else PLAYER_O
+    my_score, op_score = 0, 0
+
+    # Horizontal dan Vertikal
+    for i in range(n):
+        row = board[i]
+        col = [board[r][i] for r in range(n)]
+        my_score += evaluate_line(row, player)
+        op_score += evaluate_line(row, opponent)
+        my_score += evaluate_line(col, player)
+        op_score += evaluate_line(col, opponent)
+
+    # Diagonal \
+    for k in range(-n + 1, n):
+        diag = [board[r][r - k] for r in range(n) if 0 <= r - k < n]
+        if len(diag) >= 5:
+            my_score += evaluate_line(diag, player)
+            op_score += evaluate_line(diag, opponent)
+
+    # Diagonal /
+    for k in range(2 * n - 1):
+        diag = [board[r][k - r] for r in range(n) if 0 <= k - r < n]
+        if len(diag) >= 5:
+            my_score += evaluate_line(diag, player)
+            op_score += evaluate_line(diag, opponent)
+
+    # Lebih defensif — penalti lawan lebih besar
+    return my_score - (op_score * defense_weight)
+
+
+# --- EVALUASI DI ATAS BITBOARD ---
+# Skor run dengan panjang k dan 0/1/2 ujung terbuka, diambil dari SCORE_TABLE
+_RUN_SCORES = [tuple(SCORE_TABLE.get((k, ends), 0) for ends in range(3)) for k in range(6)]
+
+
+def _score_bits(bits, empty):
+    """Hitung total skor run milik `bits` di keempat arah dengan shift-and-mask.
+
+    Hasilnya identik dengan menjumlahkan evaluate_line untuk setiap garis
+    yang dipakai evaluate_board (diagonal dengan panjang < 5 diabaikan).
+    """
+    score = 0
+    for s, line_mask in zip(SHIFTS, LINE_MASKS):
+        b = bits & line_mask
+        if not b:
+            continue
+        e = empty & line_mask
+        starts = b & ~(b << s)   # bidak yang tidak didahului bidak sendiri
+        before = e << s          # sel sebelum run kosong
+        run = b
+        for k in range(1, 6):
+            longer = run & (b >> (k * s))
+            exact = starts & run & ~longer
+            if exact:
+                after = e >> (k * s)
+                s0, s1, s2 = _RUN_SCORES[k]
+                score += (exact & before & after).bit_count() * s2
+                score += (exact & (before ^ after)).bit_count() * s1
+                if s0:
+                    score += (exact & ~(before | after)).bit_count() * s0
+            run = longer
+            if not run:
+                break
+    return score
+
+
+def evaluate_bitboard(board, player, defense_weight=1.5):
+    """Versi evaluate_board untuk BitBoard, hasilnya sama persis."""
+    opponent = PLAYER_X if player == PLAYER_O else PLAYER_O
+    empty = board.empty
+    my_score = _score_bits(board.bits(player), empty)
+    op_score = _score_bits(board.bits(opponent), empty)
+    return my_score - (op_score * defense_weight)
+
+
+# --- EVALUASI INKREMENTAL ---
+def _build_lines():
+    # Urutan dan pemilihan garis sama dengan evaluate_board
+    n = BOARD_SIZE
+    lines = []
+    for i in range(n):
+        lines.append([(i, c) for c in range(n)])
+        lines.append([(r, i) for r in range(n)])
+    for k in range(-n + 1, n):
+        diag = [(r, r - k) for r in range(n) if 0 <= r - k < n]
+        if len(diag) >= 5:
+            lines.append(diag)
+    for k in range(2 * n - 1):
+        diag = [(r, k - r) for r in range(n) if 0 <= k - r < n]
+        if len(diag) >= 5:
+            lines.append(diag)
+    return lines
+
+
+LINES = _build_lines()
+LINE_LENGTHS = [len(line) for line in LINES]
+
+# Untuk setiap indeks sel: tuple (id garis, bit posisi sel di garis itu)
+CELL_LINES = {}
+for _ln, _line in enumerate(LINES):
+    for _pos, (_r, _c) in enumerate(_line):
+        CELL_LINES.setdefault(cell_index(_r, _c), []).append((_ln, 1 << _pos))
+CELL_LINES = [tuple(CELL_LINES.get(idx, ())) for idx in range(max(CELL_LINES) + 1)]
+
+
+# Tabel pola dibangun sekali dari SCORE_TABLE saat modul di-import
+PATTERNS = PatternScorer(SCORE_TABLE)
+
+
+@lru_cache(maxsize=1 << 18)
+def line_scores(length, x_line, o_line):
+    """Skor (X, O) untuk satu garis yang dikodekan sebagai dua bitmask ringkas."""
+    return PATTERNS.score_line(length, x_line, o_line)
+
+
+class IncrementalEvaluator:
+    """Cache skor per garis untuk kedua pemain; place/undo hanya menghitung ulang
+    (maksimal) empat garis yang melewati sel tersebut.
+
+    evaluate() menghasilkan nilai yang sama persis dengan evaluate_board.
+    """
+
+    __slots__ = ("line_x", "line_o", "score_x", "score_o", "total_x", "total_o", "_stack")
+
+    def __init__(self, board=None):
+        num_lines = len(LINES)
+        self.line_x = [0] * num_lines
+        self.line_o = [0] * num_lines
+        self.score_x = [0] * num_lines
+        self.score_o = [0] * num_lines
+        self.total_x = 0
+        self.total_o = 0
+        self._stack = []
+        if board is not None:
+            for idx in iter_indices(board.x_bits):
+                for ln, bit in CELL_LINES[idx]:
+                    self.line_x[ln] |= bit
+            for idx in iter_indices(board.o_bits):
+                for ln, bit in CELL_LINES[idx]:
+                    self.line_o[ln] |= bit
+            for ln in range(num_lines):
+                sx, so = line_scores(LINE_LENGTHS[ln], self.line_x[ln], self.line_o[ln])
+                self.score_x[ln] = sx
+                self.score_o[ln] = so
+                self.total_x += sx
+                self.total_o += so
+
+    def place(self, r, c, player):
+        line_bits = self.line_x if player == PLAYER_X else self.line_o
+        line_x, line_o = self.line_x, self.line_o
+        score_x, score_o = self.score_x, self.score_o
+        saved = []
+        for ln, bit in CELL_LINES[cell_index(r, c)]:
+            line_bits[ln] |= bit
+            sx, so = line_scores(LINE_LENGTHS[ln], line_x[ln], line_o[ln])
+            saved.append((ln, score_x[ln], score_o[ln]))
+            self.total_x += sx - score_x[ln]
+            self.total_o += so - score_o[ln]
+            score_x[ln] = sx
+            score_o[ln] = so
+        self._stack.append(saved)
+
+    def undo(self, r, c):
+        for ln, bit in CELL_LINES[cell_index(r, c)]:
+            self.line_x[ln] &= ~bit
+            self.line_o[ln] &= ~bit
+        for ln, sx, so in self._stack.pop():
+            self.total_x += sx - self.score_x[ln]
+            self.total_o += so - self.score_o[ln]
+            self.score_x[ln] = sx
+            self.score_o[ln] = so
+
+    def evaluate(self, player, defense_weight=1.5):
+        if player == PLAYER_X:
+            my_score, op_score = self.total_x, self.total_o
+        else:
+            my_score, op_score = self.total_o, self.total_x
+        return my_score - (op_score * defense_weight)
+
+
+# --- SELF-CHECK: SEMUA EVALUATOR HARUS SAMA PERSIS DENGAN evaluate_board ---
+def random_boards(count, max_stones=80, seed=0):
+    """Papan acak yang rapat (bidak dipasang di sekitar bidak lain, pemain acak),
+    supaya run panjang, run >= 6 dan ujung tertutup sering muncul."""
+    rng = random.Random(seed)
+    boards = []
+    for _ in range(count):
+        board = BitBoard()
+        moves = []
+        for _ in range(rng.randint(0, max_stones)):
+            r, c = rng.choice(board.candidate_moves(1))
+            player = rng.choice((PLAYER_X, PLAYER_O))
+            board.place(r, c, player)
+            moves.append((r, c, player))
+        boards.append((board, moves))
+    return boards
+
+
+def check_equivalence(count=200, seed=0, defense_weight=1.5):
+    """Bandingkan evaluate_line/evaluate_board dengan PatternScorer,
+    evaluate_bitboard, IncrementalEvaluator (place/undo) dan, jika numpy ada,
+    batch_eval. Mengembalikan list ketidakcocokan; kosong berarti sama persis.
+    """
+    mismatches = []
+    boards = random_boards(count, seed=seed)
+    for n, (board, moves) in enumerate(boards):
+        grid = board.to_grid()
+        for ln, line in enumerate(LINES):
+            values = [grid[r][c] for r, c in line]
+            x_line = sum(1 << i for i, v in enumerate(values) if v == PLAYER_X)
+            o_line = sum(1 << i for i, v in enumerate(values) if v == PLAYER_O)
+            expected = (evaluate_line(values, PLAYER_X), evaluate_line(values, PLAYER_O))
+            if line_scores(LINE_LENGTHS[ln], x_line, o_line) != expected:
+                mismatches.append(("line_scores", n, ln))
+
+        inc = IncrementalEvaluator()
+        for r, c, player in moves:
+            inc.place(r, c, player)
+        built = IncrementalEvaluator(board)
+        for player in (PLAYER_X, PLAYER_O):
+            expected = evaluate_board(grid, player, defense_weight)
+            for name, value in (
+                ("evaluate_bitboard", evaluate_bitboard(board, player, defense_weight)),
+                ("IncrementalEvaluator.place", inc.evaluate(player, defense_weight)),
+                ("IncrementalEvaluator(board)", built.evaluate(player, defense_weight)),
+            ):
+                if value != expected:
+                    mismatches.append((name, n, player))
+        for r, c, _ in reversed(moves):
+            inc.undo(r, c)
+        if inc.total_x or inc.total_o:
+            mismatches.append(("IncrementalEvaluator.undo", n, None))
+
+    try:
+        from agents.batch_eval import evaluate_boards
+    except ImportError:     # numpy tidak terpasang: batch_eval dilewati
+        return mismatches
+    for player in (PLAYER_X, PLAYER_O):
+        scores = evaluate_boards([board for board, _ in boards], player, defense_weight)
+        for n, (board, _) in enumerate(boards):
+            if scores[n] != evaluate_board(board.to_grid(), player, defense_weight):
+                mismatches.append(("batch_eval.evaluate_boards", n, player))
+    return mismatches
+
+
+if __name__ == "__main__":
+    import sys
+
+    found = check_equivalence()
+    for mismatch in found[:20]:
+        print("mismatch:", *mismatch)
+    print(f"{len(found)} mismatches")
+    sys.exit(1 if found else 0)
@@ -0,0 +1,97 @@
+from functools import lru_cache
+
+from agents.bitboard import (
+    BOARD_SIZE, CENTER, cell_index, mask_cells,
+)
+
+# ==============================
+# NEIGHBOUR TABLES
+# ==============================
+@lru_cache(maxsize=None)
+def neighbour_table(radius):
+    """Untuk setiap indeks sel: tuple indeks sel dalam kotak radius (termasuk sel itu sendiri)."""
+    table = {}
+    for r in range(BOARD_SIZE):
+        for c in range(BOARD_SIZE):
+            table[cell_index(r, c)] = tuple(
+                cell_index(i, j)
+                for i in range(max(0, r - radius), min(BOARD_SIZE, r + radius + 1))
+                for j in range(max(0, c - radius), min(BOARD_SIZE, c + radius + 1))
+            )
+    return [table.get(idx, ()) for idx in range(max(table) + 1)]
+
+
+@lru_cache(maxsize=None)
+def neighbour_masks(radius):
+    """Versi bitmask dari neighbour_table: satu integer per sel."""
+    masks = []
+    for cells in neighbour_table(radius):
+        m = 0
+        for n in cells:
+            m |= 1 << n
+        masks.append(m)
+    return masks
+
+
+# ==============================
+# FRONTIER
+# ==============================
+class Frontier:
+    """Himpunan sel kosong dalam jarak `radius` dari bidak mana pun.
+
+    place() menambahkan mask tetangga sel yang dipasang (dua operasi integer),
+    dan menyimpan mask sebelumnya di stack sehingga undo() mengembalikan
+    keadaan yang persis sama. Undo harus dipanggil dengan urutan LIFO, seperti
+    make/unmake di dalam pencarian.
+    """
+
+    __slots__ = ("radius", "mask", "occupied", "_masks", "_stack")
+
+    def __init__(self, radius):
+        self.radius = radius
+        self._masks = neighbour_masks(radius)
+        self.mask = 0
+        self.occupied = 0
+        self._stack = []
+
+    @classmethod
+    def from_board(cls, board, radius):
+        frontier = cls(radius)
+        frontier.occupied = board.occupied
+        frontier.mask = board.neighbourhood(radius)
+        return frontier
+
+    def copy(self):
+        clone = Frontier.__new__(Frontier)
+        clone.radius = self.radius
+        clone._masks = self._masks
+        clone.mask = self.mask
+        clone.occupied = self.occupied
+        clone._stack = list(self._stack)    # undo pada salinan tetap bisa sampai ke awal
+        return clone
+
+    def place_index(self, idx):
+        self._stack.append(self.mask)
+        self.occupied |= 1 << idx
+        self.mask = (self.mask | self._masks[idx]) & ~self.occupied
+
+    def undo_index(self, idx):
+        self.occupied &= ~(1 << idx)
+        self.mask = self._stack.pop()
+
+    def place(self, r, c):
+        self.place_index(cell_index(r, c))
+
+    def undo(self, r, c):
+        self.undo_index(cell_index(r, c))
+
+    def __len__(self):
+        return self.mask.bit_count()
+
+    def __contains__(self, move):
+        return bool(self.mask >> cell_index(*move) & 1)
+
+    def moves(self):
+        if not self.occupied:
+            return [CENTER]
+        return mask_cells(self.mask)
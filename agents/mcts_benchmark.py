@@ -0,0 +1,181 @@
+import random
+import time
+
+from agents.bitboard import BOARD_SIZE, BitBoard, PLAYER_X, PLAYER_O, has_five_bits
+from agents.mcts_optimized_agent import MCTSAgent, make_tree, run_anytime
+from agents.rollout import ROLLOUT_POLICIES, get_rollout_engine
+from agents.threat_search import find_forced_win
+
+MAX_PLIES = BOARD_SIZE * BOARD_SIZE
+
+
+# ==============================
+# MATCH
+# ==============================
+def play_game(config_x, config_o, seed=None):
+    """Satu permainan MCTS vs MCTS; kembalikan PLAYER_X, PLAYER_O, atau None (seri)."""
+    if seed is not None:
+        random.seed(seed)
+    agents = {PLAYER_X: MCTSAgent(config_x, PLAYER_X), PLAYER_O: MCTSAgent(config_o, PLAYER_O)}
+    board = BitBoard()
+    player = PLAYER_X
+    for _ in range(MAX_PLIES):
+        move = agents[player].get_move(board)
+        if move is None:
+            break
+        board.place(move[0], move[1], player)
+        if board.wins_at(move[0], move[1], player):
+            return player
+        player = PLAYER_O if player == PLAYER_X else PLAYER_X
+    return None
+
+
+def play_match(config_a, config_b, games=10, seed=0):
+    """Skor config_a melawan config_b (menang 1, seri 0.5), warna bergantian tiap game."""
+    score = 0.0
+    for g in range(games):
+        a_is_x = g % 2 == 0
+        winner = play_game(config_a if a_is_x else config_b, config_b if a_is_x else config_a, seed + g)
+        if winner is None:
+            score += 0.5
+        elif (winner == PLAYER_X) == a_is_x:
+            score += 1.0
+    return score / games
+
+
+# ==============================
+# BUDGET BENCHMARKS (RAVE, WIDENING)
+# ==============================
+def benchmark_fractions(config, enabled, fractions=(0.1, 0.25, 0.5), games=10, seed=0):
+    """Config dengan opsi `enabled` dan sebagian kecil num_simulations melawan
+    config tanpa opsi itu dengan anggaran penuh.
+
+    Kembalikan list (fraction, simulasi, skor); skor sekitar 0.5 berarti
+    kekuatan setara dengan anggaran yang lebih kecil.
+    """
+    base = dict(config, early_stop=False, **{key: False for key in enabled})
+    base.pop("time_ms", None)
+    rows = []
+    for fraction in fractions:
+        sims = max(1, int(base["num_simulations"] * fraction))
+        variant = dict(base, num_simulations=sims, **enabled)
+        rows.append((fraction, sims, play_match(variant, base, games, seed)))
+    return rows
+
+
+def benchmark_rave(config, fractions=(0.1, 0.25, 0.5), games=10, seed=0):
+    """RAVE dengan sebagian kecil num_simulations melawan UCT biasa dengan anggaran penuh."""
+    return benchmark_fractions(config, {"rave": True}, fractions, games, seed)
+
+
+def benchmark_widening(config, fractions=(0.1, 0.25, 0.5), games=10, seed=0):
+    """Progressive widening + prior dengan sebagian kecil num_simulations melawan UCT biasa."""
+    return benchmark_fractions(config, {"widening": True}, fractions, games, seed)
+
+
+# ==============================
+# ROLLOUT POLICY BENCHMARK
+# ==============================
+def random_positions(count, stones=12, seed=0):
+    rng = random.Random(seed)
+    positions = []
+    for _ in range(count):
+        board = BitBoard()
+        for i in range(stones):
+            r, c = rng.choice(board.candidate_moves(1))
+            board.place(r, c, PLAYER_X if i % 2 == 0 else PLAYER_O)
+        positions.append(board)
+    return positions
+
+
+def rollouts_per_sec(config, policy, positions, rollouts=200):
+    engine = get_rollout_engine(config["rollout_radius"], policy)
+    start = time.perf_counter()
+    for board in positions:
+        player = board.side_to_move()
+        for _ in range(rollouts):
+            engine.run(board, player, config["max_rollout_steps"])
+    return len(positions) * rollouts / (time.perf_counter() - start)
+
+
+def benchmark_rollout_policy(config, games=10, time_ms=150, seed=0):
+    """Biaya dan kualitas tiap kebijakan rollout dibanding "random".
+
+    Kembalikan list (policy, rollouts/s, skor vs random dengan num_simulations
+    sama, skor vs random dengan batas waktu `time_ms` sama).
+    """
+    base = dict(config, rollout_policy="random", early_stop=False)
+    base.pop("time_ms", None)
+    positions = random_positions(10, seed=seed)
+    rows = []
+    for policy in ROLLOUT_POLICIES:
+        cfg = dict(base, rollout_policy=policy)
+        rows.append((
+            policy,
+            rollouts_per_sec(cfg, policy, positions),
+            play_match(cfg, base, games, seed),
+            play_match(dict(cfg, time_ms=time_ms), dict(base, time_ms=time_ms), games, seed),
+        ))
+    return rows
+
+
+# ==============================
+# SOLVER BENCHMARK
+# ==============================
+def tactical_positions(count, stones=16, seed=0, max_tries=1000):
+    """Posisi acak tanpa lima yang punya menang paksa (VCF/VCT) untuk pemain yang jalan."""
+    rng = random.Random(seed)
+    positions = []
+    for _ in range(max_tries):
+        if len(positions) >= count:
+            break
+        board = BitBoard()
+        for i in range(stones):
+            r, c = rng.choice(board.candidate_moves(1))
+            board.place(r, c, PLAYER_X if i % 2 == 0 else PLAYER_O)
+        if has_five_bits(board.x_bits) or has_five_bits(board.o_bits):
+            continue
+        if find_forced_win(board, board.side_to_move()) is not None:
+            positions.append(board)
+    return positions
+
+
+def benchmark_solver(config, positions, seed=0):
+    """Simulasi yang dipakai dengan dan tanpa "solver" pada posisi taktis.
+
+    Kembalikan list (solver, total simulasi, jumlah root terbukti, waktu ms).
+    """
+    base = dict(config, early_stop=False, threat_nodes=0)
+    base.pop("time_ms", None)
+    rows = []
+    for solver in (False, True):
+        cfg = dict(base, solver=solver)
+        simulations = proven = 0
+        elapsed = 0.0
+        for board in positions:
+            random.seed(seed)
+            tree = make_tree(cfg)
+            stats = run_anytime(tree, board, cfg, board.side_to_move())
+            simulations += stats["simulations"]
+            proven += stats["proven"] is not None
+            elapsed += stats["time_ms"]
+        rows.append((solver, simulations, proven, elapsed))
+    return rows
+
+
+if __name__ == "__main__":
+    from agents.config_registry import get_mcts_level
+
+    bench_config = get_mcts_level("mcts_medium")
+    for name, benchmark in (("rave", benchmark_rave), ("widening", benchmark_widening)):
+        print(f"\n{name:>8} {'sims':>6} {'score':>6}")
+        for fraction, sims, score in benchmark(bench_config):
+            print(f"{fraction:>8.2f} {sims:>6} {score:>6.2f}")
+
+    print(f"\n{'solver':>8} {'sims':>8} {'proven':>6} {'ms':>8}")
+    for solver, sims, proven, ms in benchmark_solver(bench_config, tactical_positions(10)):
+        print(f"{str(solver):>8} {sims:>8} {proven:>6} {ms:>8.0f}")
+
+    print(f"\n{'policy':>8} {'rollouts/s':>10} {'=sims':>6} {'=time':>6}")
+    for policy, rate, score_sims, score_time in benchmark_rollout_policy(bench_config):
+        print(f"{policy:>8} {rate:>10.0f} {score_sims:>6.2f} {score_time:>6.2f}")
@@ -1,198 +1,375 @@
 import math
-import random
 import time
-import json
-import os
+
+from agents.bitboard import as_bitboard, cell_index, index_cell, mask_cells
+from agents.config_registry import get_mcts_level
+from agents.frontier import neighbour_masks
+from agents.rollout import get_rollout_engine
+from agents.threat_search import DEFAULT_MAX_NODES, DEFAULT_TIME_MS, find_forced_win
+from agents.threats import five_moves, four_moves, open_three_moves
 
 EMPTY = 0
 PLAYER_X = 1
 PLAYER_O = 2
 
-# ==============================
-# LOAD CONFIG
-# ==============================
-def load_mcts_config():
-    config_path = os.path.join(
-        os.path.dirname(__file__),
-        "config",
-        "agent_config.json"
-    )
-    with open(config_path, "r") as f:
-        return json.load(f)
-
-# ==============================
-# WIN CHECK (LOCAL)
-# ==============================
-def check_win_around(board, r, c, player):
-    n = len(board)
-    directions = [(0,1), (1,0), (1,1), (1,-1)]
+ANYTIME_CHUNK = 16      # simulasi per potongan sebelum cek waktu / early stop
 
-    for dr, dc in directions:
-        count = 1
+# RAVE: default jadwal beta jika tidak diatur di config
+RAVE_K = 50             # "equivalence": jumlah visit saat bobot UCT dan AMAF sama
+RAVE_BIAS = 0.1         # "mse": perkiraan bias nilai AMAF
 
-        for i in range(1, 5):
-            nr, nc = r + dr*i, c + dc*i
-            if 0 <= nr < n and 0 <= nc < n and board[nr][nc] == player:
-                count += 1
-            else:
-                break
+# Progressive widening: anak yang boleh dipilih = ceil(k * (visits + 1) ** alpha)
+WIDENING_K = 2
+WIDENING_ALPHA = 0.4
+PUCT_C = 1.0            # bobot suku prior pada seleksi
 
-        for i in range(1, 5):
-            nr, nc = r - dr*i, c - dc*i
-            if 0 <= nr < n and 0 <= nc < n and board[nr][nc] == player:
-                count += 1
-            else:
-                break
+# MCTS-Solver: nilai terbukti sebuah node, dari sudut pandang pemain yang
+# memainkan langkah ke node itu
+PROVEN_WIN = 1
+PROVEN_LOSS = -1
 
-        if count >= 5:
-            return True
+# Bobot prior langkah (dijumlahkan, lalu dinormalisasi per node)
+PRIOR_WIN = 1000        # langsung lima
+PRIOR_BLOCK_FIVE = 500  # menutup four lawan
+PRIOR_FOUR = 50         # membuat four sendiri
+PRIOR_OPEN_THREE = 30   # membuat open three sendiri
+PRIOR_BLOCK_FOUR = 20   # menutup sel four lawan
+PRIOR_BLOCK_THREE = 15  # menutup sel open three lawan
+PRIOR_QUIET = 1         # ditambah satu per bidak di 8 sel sekitarnya
 
-    return False
+# Statistik pencarian terakhir (simulasi, rollout/detik, alasan berhenti), untuk logging/monitoring
+LAST_SEARCH_STATS = {}
 
 # ==============================
-# MOVE GENERATION
+# RAVE / AMAF
 # ==============================
-def get_neighboring_moves(board, radius):
-    n = len(board)
-    moves = set()
-    has_piece = False
-
-    for r in range(n):
-        for c in range(n):
-            if board[r][c] != EMPTY:
-                has_piece = True
-                for i in range(max(0, r-radius), min(n, r+radius+1)):
-                    for j in range(max(0, c-radius), min(n, c+radius+1)):
-                        if board[i][j] == EMPTY:
-                            moves.add((i, j))
+def rave_beta(config):
+    """Jadwal beta dari config: "equivalence" sqrt(k / (3n + k)) atau "mse" (Silver)."""
+    if config.get("rave_schedule", "equivalence") == "mse":
+        b2 = 4 * config.get("rave_bias", RAVE_BIAS) ** 2
+        return lambda n, amaf_n: amaf_n / (n + amaf_n + b2 * n * amaf_n)
+    k = config.get("rave_k", RAVE_K)
+    return lambda n, amaf_n: (k / (3 * n + k)) ** 0.5   # juga untuk array NumPy
 
-    if not has_piece:
-        return [(n//2, n//2)]
-
-    return list(moves)
 
 # ==============================
-# MCTS NODE
+# PROGRESSIVE WIDENING
 # ==============================
-class MCTSNode:
-    def __init__(self, board, config, parent=None, move=None, player_to_move=PLAYER_X):
-        self.board = [row[:] for row in board]
-        self.config = config
-        self.parent = parent
-        self.move = move
-        self.player_to_move = player_to_move
-
-        self.children = []
-        self.untried_moves = get_neighboring_moves(
-            self.board, config["neighbor_radius"]
-        )
-
-        self.visits = 0
-        self.wins = 0.0
-
-    def ucb1(self):
-        if self.visits == 0:
-            return float("inf")
-        c = self.config["uct_c"]
-        return (self.wins / self.visits) + c * math.sqrt(
-            math.log(self.parent.visits) / self.visits
-        )
-
-    def expand(self):
-        move = self.untried_moves.pop()
-        r, c = move
-
-        new_board = [row[:] for row in self.board]
-        new_board[r][c] = self.player_to_move
-
-        next_player = PLAYER_X if self.player_to_move == PLAYER_O else PLAYER_O
-        child = MCTSNode(new_board, self.config, self, move, next_player)
-        self.children.append(child)
-        return child
-
-    def is_terminal(self):
-        if self.move is None:
-            return False
-        r, c = self.move
-        prev_player = PLAYER_X if self.player_to_move == PLAYER_O else PLAYER_O
-        return check_win_around(self.board, r, c, prev_player)
+def widening_limit(config):
+    """Fungsi visits -> jumlah anak yang boleh dipilih, atau None jika widening mati."""
+    if not config.get("widening"):
+        return None
+    k = config.get("widening_k", WIDENING_K)
+    alpha = config.get("widening_alpha", WIDENING_ALPHA)
+    return lambda visits: math.ceil(k * (visits + 1) ** alpha)
+
+
+def move_priors(board, moves, mover):
+    """Prior ternormalisasi untuk `moves`: ancaman sendiri/lawan plus jumlah bidak di sekitarnya."""
+    opponent = PLAYER_X if mover == PLAYER_O else PLAYER_O
+    own = board.bits(mover)
+    opp = board.bits(opponent)
+    empty = board.empty
+    occupied = board.occupied
+    tiers = (
+        (five_moves(own, empty), PRIOR_WIN),
+        (five_moves(opp, empty), PRIOR_BLOCK_FIVE),
+        (four_moves(own, empty), PRIOR_FOUR),
+        (open_three_moves(own, empty), PRIOR_OPEN_THREE),
+        (four_moves(opp, empty), PRIOR_BLOCK_FOUR),
+        (open_three_moves(opp, empty), PRIOR_BLOCK_THREE),
+    )
+    near = neighbour_masks(1)
+    weights = []
+    for r, c in moves:
+        idx = cell_index(r, c)
+        w = PRIOR_QUIET + (near[idx] & occupied).bit_count()
+        for mask, bonus in tiers:
+            if mask >> idx & 1:
+                w += bonus
+        weights.append(w)
+    total = sum(weights)
+    return [w / total for w in weights]
 
-    def is_fully_expanded(self):
-        return len(self.untried_moves) == 0
+# ==============================
+# EXPANSION
+# ==============================
+def expansion_moves(board, radius, mover, solver=False):
+    """Langkah anak sebuah node: sel kosong dalam `radius` dari bidak.
+
+    Dengan "solver", sel five/four kedua pihak ikut dimasukkan walaupun di
+    luar radius (mis. menutup ujung jauh open three lawan saat radius 1),
+    supaya "semua anak terbukti kalah" tidak melewatkan pertahanan. Dengan
+    radius >= 2 hasilnya sama dengan candidate_moves.
+    """
+    if not solver or not board.count:
+        return board.candidate_moves(radius)
+    opponent = PLAYER_X if mover == PLAYER_O else PLAYER_O
+    own = board.bits(mover)
+    opp = board.bits(opponent)
+    empty = board.empty
+    threats = five_moves(own, empty) | five_moves(opp, empty)
+    threats |= four_moves(own, empty) | four_moves(opp, empty)
+    return mask_cells(board.neighbourhood(radius) | threats)
 
 # ==============================
 # ROLLOUT
 # ==============================
-def simulate_rollout(board, current_player, config):
-    sim_board = [row[:] for row in board]
-    curr = current_player
-    steps = 0
+def simulate_rollout(board, current_player, config, moves=None):
+    engine = get_rollout_engine(config["rollout_radius"], config.get("rollout_policy", "random"))
+    return engine.run(board, current_player, config["max_rollout_steps"], moves=moves)
+
+
+def rollout_batch(jobs, config, moves=None):
+    """Rollout untuk list (board, mover); ke process pool jika config["rollout_workers"] > 1.
+
+    Jika `moves` diberikan (list), daftar langkah tiap rollout ditambahkan ke sana (untuk AMAF).
+    Dengan "rollout_policy": "numpy", seluruh batch dimainkan serentak oleh satu kernel array.
+    """
+    if config.get("rollout_policy") == "numpy":
+        engine = get_rollout_engine(config["rollout_radius"], "numpy")
+        return engine.run_batch(jobs, config["max_rollout_steps"], moves)
+    workers = config.get("rollout_workers", 1)
+    if workers > 1 and len(jobs) > 1:
+        from agents.parallel_mcts import parallel_rollouts
+        return parallel_rollouts(jobs, config, workers, moves)
+    results = []
+    for b, mover in jobs:
+        job_moves = [] if moves is not None else None
+        results.append(simulate_rollout(b, mover, config, job_moves))
+        if moves is not None:
+            moves.append(job_moves)
+    return results
+
+# ==============================
+# MCTS TREE
+# ==============================
+def make_tree(config):
+    # Diimpor di sini karena agents.mcts_tree mengimpor modul ini
+    from agents.mcts_tree import ArrayTree, DEFAULT_CAPACITY
+    return ArrayTree(config.get("tree_capacity", DEFAULT_CAPACITY))
+
 
-    while steps < config["max_rollout_steps"]:
-        moves = get_neighboring_moves(sim_board, config["rollout_radius"])
-        if not moves:
+# ==============================
+# ANYTIME SEARCH
+# ==============================
+def _decided(tree, remaining):
+    # True jika anak root dengan visit terbanyak tidak bisa disusul lagi
+    visits = sorted((v for _, v, _ in tree.root_children()), reverse=True)
+    if not visits:
+        return False
+    runner_up = visits[1] if len(visits) > 1 else 0
+    return visits[0] - runner_up > remaining
+
+
+def run_anytime(tree, board, config, root_player, start=None):
+    """Simulasi dalam potongan kecil sampai anggaran habis; kembalikan statistik pencarian.
+
+    Anggaran adalah config["time_ms"] jika ada (num_simulations diabaikan),
+    selain itu config["num_simulations"]. Dengan "early_stop" (default True),
+    pencarian berhenti begitu anak root teratas tidak bisa disusul oleh sisa
+    anggaran, sehingga langkah yang dipilih sama dengan jika anggaran dipakai
+    habis. Pencarian juga berhenti begitu root hanya punya satu anak, dan
+    dengan "solver" begitu nilai root terbukti (juga jika sudah terbukti
+    sebelum pencarian dimulai). `start` (time.perf_counter()) memasukkan waktu yang sudah
+    terpakai sebelumnya, mis. untuk pencarian ancaman; minimal satu potongan
+    simulasi tetap dijalankan walaupun waktunya sudah habis.
+    """
+    if start is None:
+        start = time.perf_counter()
+    time_ms = config.get("time_ms")
+    deadline = start + time_ms / 1000.0 if time_ms else None
+    max_simulations = math.inf if deadline is not None else config["num_simulations"]
+    early_stop = config.get("early_stop", True)
+    # Potongan minimal satu batch penuh supaya batch rollout tidak terpotong
+    chunk = max(ANYTIME_CHUNK, config.get("batch_size", 1))
+    search_start = time.perf_counter()
+
+    done = 0
+    stop_reason = "simulations"
+    while done < max_simulations:
+        # Potongan pertama selalu dijalankan supaya root punya anak untuk dipilih
+        if deadline is not None and done and time.perf_counter() >= deadline:
+            stop_reason = "time"
+            break
+        if tree.proven is not None:
+            stop_reason = "proven"
             break
+        if len(tree.root_children()) == 1:
+            # Hanya satu langkah yang mungkin: simulasi tidak mengubah pilihan
+            stop_reason = "single_move"
+            break
+        n = min(chunk, max_simulations - done)
+        done += tree.search(board, config, root_player, n)
+
+        if early_stop and done < max_simulations:
+            remaining = max_simulations - done
+            if deadline is not None:
+                now = time.perf_counter()
+                remaining = done / (now - search_start) * max(deadline - now, 0.0)
+            if _decided(tree, remaining):
+                stop_reason = "early_stop"
+                break
 
-        r, c = random.choice(moves)
-        sim_board[r][c] = curr
+    elapsed = time.perf_counter() - search_start
+    return {
+        "simulations": done,
+        "time_ms": (time.perf_counter() - start) * 1000.0,
+        "rollouts_per_sec": done / elapsed if elapsed else 0.0,
+        "stop_reason": stop_reason,
+        "proven": tree.proven,
+    }
 
-        if check_win_around(sim_board, r, c, curr):
-            return 1.0 if curr == PLAYER_O else 0.0
 
-        curr = PLAYER_X if curr == PLAYER_O else PLAYER_O
-        steps += 1
+def find_threat_win(board, config, player):
+    """Menang paksa (VCF/VCT) dengan batas node dan waktu dari level.
+
+    Dengan time_ms, pencarian ancaman memakai paling banyak seperempat
+    anggaran, sama seperti minimax; sisanya untuk simulasi.
+    """
+    threat_time = config.get("threat_time_ms", DEFAULT_TIME_MS)
+    if "time_ms" in config:
+        threat_time = min(threat_time, config["time_ms"] / 4)
+    return find_forced_win(board, player, config.get("threat_nodes", DEFAULT_MAX_NODES), threat_time)
 
-    return 0.5
 
-# ==============================
-# MCTS SEARCH
-# ==============================
 def mcts_search(board, config, root_player):
-    root = MCTSNode(board, config, player_to_move=root_player)
-    start_time = time.time()
-
-    for _ in range(config["num_simulations"]):
-        node = root
-
-        # Selection
-        while node.is_fully_expanded() and node.children:
-            node = max(node.children, key=lambda c: c.ucb1())
-
-        # Expansion
-        if not node.is_terminal() and not node.is_fully_expanded():
-            node = node.expand()
-
-        # Simulation
-        if node.move:
-            prev_player = PLAYER_X if node.player_to_move == PLAYER_O else PLAYER_O
-            if check_win_around(node.board, node.move[0], node.move[1], prev_player):
-                sim_result = 1.0 if prev_player == PLAYER_O else 0.0
-            else:
-                sim_result = simulate_rollout(node.board, node.player_to_move, config)
-        else:
-            sim_result = simulate_rollout(node.board, node.player_to_move, config)
+    start = time.perf_counter()
+    # Menang paksa (VCF/VCT) yang terbukti langsung dimainkan tanpa simulasi
+    win_move = find_threat_win(board, config, root_player)
+    if win_move is not None:
+        LAST_SEARCH_STATS.clear()
+        LAST_SEARCH_STATS.update(simulations=0, stop_reason="forced_win", forced_win=True)
+        return win_move
+
+    if config.get("workers", 1) > 1:
+        move, stats = _parallel_search(board, config, root_player)
+    else:
+        tree = make_tree(config)
+        stats = run_anytime(tree, board, config, root_player, start)
+        move = tree.best_move()
+    LAST_SEARCH_STATS.clear()
+    LAST_SEARCH_STATS.update(stats, forced_win=False)
+    return move
+
+
+def _parallel_search(board, config, root_player):
+    # Root-parallel di beberapa proses (diimpor di sini karena modulnya mengimpor modul ini)
+    from agents.parallel_mcts import parallel_mcts
+    move, stats = parallel_mcts(board, config, root_player, config["workers"], config.get("time_ms"))
+    stats["rollouts_per_sec"] = stats["simulations_per_sec"]
+    stats["stop_reason"] = "time" if config.get("time_ms") else "simulations"
+    return move, stats
 
-        reward = sim_result if root_player == PLAYER_O else 1.0 - sim_result
+# ==============================
+# STATEFUL MCTS (TREE REUSE)
+# ==============================
+class MCTSAgent:
+    """MCTS yang menyimpan pohonnya antar langkah.
 
-        # Backpropagation
-        while node:
-            node.visits += 1
-            node.wins += reward
-            node = node.parent
+    Setelah memilih langkah, subtree di bawah langkah itu disimpan. Pada
+    panggilan berikutnya, balasan lawan dicari di antara anak subtree
+    tersebut (cucu dari root lama) dan pencarian dilanjutkan dari sana,
+    sehingga visit yang sudah terkumpul tidak dibuang.
+    """
 
-    best_child = max(root.children, key=lambda c: c.visits)
+    def __init__(self, config, player):
+        self.config = config
+        self.player = player
+        self.tree = make_tree(config)
+        self.root_board = None  # posisi root pohon; None = belum ada pohon yang bisa dipakai
+        self.last_stats = {}
+
+    def reset(self):
+        self.tree.reset()
+        self.root_board = None
+
+    def advance(self, move):
+        """Beritahu agen langkah yang dimainkan (mis. balasan lawan); root dipindah ke anak yang cocok."""
+        if self.root_board is None:
+            return
+        if self.tree.advance(move):
+            self.root_board.place(move[0], move[1], self.root_board.side_to_move())
+        else:
+            self.root_board = None
 
-    return best_child.move
+    def _sync(self, board):
+        # Cocokkan papan sekarang dengan root tersimpan: harus tepat satu bidak lawan baru
+        if self.root_board is None:
+            return False
+        old = self.root_board
+        new_x = board.x_bits & ~old.x_bits
+        new_o = board.o_bits & ~old.o_bits
+        if (old.x_bits & ~board.x_bits) or (old.o_bits & ~board.o_bits):
+            return False
+        opponent_bits = new_o if self.player == PLAYER_X else new_x
+        own_bits = new_x if self.player == PLAYER_X else new_o
+        if own_bits or board.count != old.count + 1:
+            return False
+        self.advance(index_cell(opponent_bits.bit_length() - 1))
+        return self.root_board is not None
+
+    def get_move(self, board):
+        start = time.perf_counter()
+        board = as_bitboard(board)
+        config = self.config
+        win_move = find_threat_win(board, config, self.player)
+        if win_move is not None:
+            self.reset()
+            self.last_stats = {"reused_visits": 0, "simulations": 0, "stop_reason": "forced_win",
+                               "forced_win": True}
+            return win_move
+
+        if config.get("workers", 1) > 1:
+            # Pohon hidup di worker, jadi tidak ada yang bisa dipakai ulang
+            self.reset()
+            move, stats = _parallel_search(board, config, self.player)
+            self.last_stats = dict(stats, reused_visits=0, forced_win=False)
+            return move
+
+        if not self._sync(board) or self.root_board != board or board.side_to_move() != self.player:
+            self.reset()
+        tree = self.tree
+        reused = tree.root_visits
+
+        stats = run_anytime(tree, board, config, self.player, start)
+        move = tree.best_move()
+
+        root_visits = tree.root_visits
+        self.last_stats = {
+            **stats,
+            "reused_visits": reused,
+            "root_visits": root_visits,
+            "reuse_rate": reused / root_visits if root_visits else 0.0,
+            "forced_win": False,
+            **tree.stats(),
+        }
+        self.root_board = board.copy()
+        self.advance(move)
+        return move
 
 # ==============================
 # PUBLIC API
 # ==============================
-def get_move_mcts(board, level="mcts_"):
-    configs = load_mcts_config()
-    config = configs["mcts"][level]
+# Satu agen per (level, pemain) supaya pohon bisa dipakai ulang antar panggilan
+_AGENTS = {}
+
 
-    x_count = sum(row.count(PLAYER_X) for row in board)
-    o_count = sum(row.count(PLAYER_O) for row in board)
+def get_mcts_agent(level, player):
+    config = get_mcts_level(level)
+    agent = _AGENTS.get((level, player))
+    # Registry mengembalikan objek yang sama sampai file berubah
+    if agent is None or agent.config is not config:
+        agent = MCTSAgent(config, player)
+        _AGENTS[(level, player)] = agent
+    return agent
 
-    current_player = PLAYER_X if x_count == o_count else PLAYER_O
-    return mcts_search(board, config, current_player)
+
+def get_move_mcts(board, level="mcts_"):
+    board = as_bitboard(board)
+    current_player = board.side_to_move()
+    agent = get_mcts_agent(level, current_player)
+    move = agent.get_move(board)
+    LAST_SEARCH_STATS.clear()
+    LAST_SEARCH_STATS.update(agent.last_stats, level=level)
+    return move
@@ -0,0 +1,376 @@
+import math
+
+import numpy as np
+
+from agents.bitboard import BOARD_SIZE, PLAYER_X, PLAYER_O, cell_index, index_cell
+from agents.mcts_optimized_agent import (
+    PROVEN_LOSS, PROVEN_WIN, PUCT_C, expansion_moves, move_priors, rave_beta, rollout_batch,
+    widening_limit,
+)
+
+DEFAULT_CAPACITY = 200_000
+UNEXPANDED = -1
+MAX_CHILDREN = BOARD_SIZE * BOARD_SIZE
+RECYCLE_FRACTION = 0.5      # bagian kapasitas yang ingin dibebaskan saat recycle
+
+
+# ==============================
+# ARRAY-BACKED MCTS TREE
+# ==============================
+class ArrayTree:
+    """Pohon MCTS sebagai structure-of-arrays NumPy.
+
+    Node 0 selalu root. Anak sebuah node dialokasikan sekaligus sebagai satu
+    blok berurutan (first_child .. first_child + num_children), sehingga UCB1
+    semua anak dihitung dengan satu ekspresi vektor. Anak selalu berindeks
+    lebih besar dari parent-nya. Jika kapasitas hampir penuh, subtree dengan
+    visit paling sedikit dilipat kembali menjadi daun (statistik node itu
+    sendiri tetap) lalu array dipadatkan. Dengan progressive widening, blok
+    anak diurutkan menurut prior dan seleksi hanya melihat k anak pertama.
+    Dengan "solver", `proven_values` menyimpan nilai terbukti tiap node (0 = belum).
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        if capacity < 2 * MAX_CHILDREN:
+            raise ValueError(f"capacity must be at least {2 * MAX_CHILDREN}")
+        self.capacity = capacity
+        self.visits = np.zeros(capacity, dtype=np.float64)
+        self.wins = np.zeros(capacity, dtype=np.float64)
+        self.amaf_visits = np.zeros(capacity, dtype=np.float64)
+        self.amaf_wins = np.zeros(capacity, dtype=np.float64)
+        self.prior = np.zeros(capacity, dtype=np.float64)
+        self.proven_values = np.zeros(capacity, dtype=np.int8)
+        self.parent = np.full(capacity, -1, dtype=np.int32)
+        self.first_child = np.full(capacity, -1, dtype=np.int32)
+        self.num_children = np.full(capacity, UNEXPANDED, dtype=np.int32)
+        self.move = np.full(capacity, -1, dtype=np.int16)   # indeks bit BitBoard
+        self.size = 1
+        self.recycles = 0
+
+    def reset(self):
+        self.visits[:self.size] = 0
+        self.wins[:self.size] = 0
+        self.amaf_visits[:self.size] = 0
+        self.amaf_wins[:self.size] = 0
+        self.prior[:self.size] = 0
+        self.proven_values[:self.size] = 0
+        self.parent[:self.size] = -1
+        self.first_child[:self.size] = -1
+        self.num_children[:self.size] = UNEXPANDED
+        self.move[:self.size] = -1
+        self.size = 1
+
+    @property
+    def root_visits(self):
+        return int(self.visits[0])
+
+    @property
+    def proven(self):
+        return int(self.proven_values[0]) or None
+
+    # --- SELECTION / EXPANSION ---
+    def _select(self, node, uct_c, beta=None, widen=None, puct_c=PUCT_C, solver=False):
+        s = self.first_child[node]
+        n = self.num_children[node]
+        if widen is not None:
+            n = min(n, widen(self.visits[node]))
+            # Semua anak yang terbuka sudah terbukti kalah: buka semuanya
+            if solver and (self.proven_values[s:s + n] == PROVEN_LOSS).all():
+                n = self.num_children[node]
+        e = s + n
+        v = self.visits[s:e]
+        i = int(v.argmin())
+        if v[i] == 0:
+            return s + i
+        value = self.wins[s:e] / v
+        if beta is not None:
+            # RAVE: campur dengan nilai AMAF untuk anak yang punya statistik AMAF
+            av = self.amaf_visits[s:e]
+            seen = av > 0
+            if seen.any():
+                b = np.where(seen, beta(v, av), 0.0)
+                value = (1 - b) * value + b * self.amaf_wins[s:e] / np.maximum(av, 1)
+        ucb = value + uct_c * np.sqrt(math.log(self.visits[node]) / v)
+        if widen is not None:
+            ucb += puct_c * self.prior[s:e] * math.sqrt(self.visits[node]) / (1 + v)
+        if solver:
+            ucb[self.proven_values[s:e] == PROVEN_LOSS] = -np.inf
+        return s + int(ucb.argmax())
+
+    def _expand(self, node, moves, priors=None):
+        n = len(moves)
+        s = self.size
+        self.first_child[node] = s
+        self.num_children[node] = n
+        self.parent[s:s + n] = node
+        self.move[s:s + n] = moves
+        if priors is not None:
+            self.prior[s:s + n] = priors
+        self.size += n
+        return s
+
+    def _update_amaf(self, nodes, path, rollout_moves, reward):
+        # All-moves-as-first: setiap langkah yang dimainkan pihak yang sama
+        # setelah sebuah node (di pohon maupun rollout) dihitung untuk anak
+        # dengan langkah itu. nodes[d] ada di kedalaman d, jadi langkah pihak
+        # yang sama sesudahnya adalah seq[d::2]
+        seq = [cell_index(r, c) for r, c in path] + rollout_moves
+        for depth, node in enumerate(nodes):
+            n = self.num_children[node]
+            if n <= 0:
+                continue
+            s = self.first_child[node]
+            hit = s + np.flatnonzero(np.isin(self.move[s:s + n], seq[depth::2]))
+            self.amaf_visits[hit] += 1
+            self.amaf_wins[hit] += reward
+
+    def _propagate_proof(self, nodes):
+        """Naikkan nilai terbukti daun `nodes[-1]` ke arah root dengan aturan min/max.
+
+        Parent terbukti kalah jika salah satu anaknya terbukti menang (lawan
+        punya balasan yang menang), dan terbukti menang jika semua anaknya
+        terbukti kalah; anak adalah semua kandidat dari expansion_moves, yang
+        juga memuat pertahanan di luar radius. Berhenti di node pertama yang
+        tidak ikut terbukti.
+        """
+        proven = self.proven_values
+        for i in range(len(nodes) - 1, 0, -1):
+            node, parent = nodes[i], nodes[i - 1]
+            if proven[parent]:
+                return
+            if proven[node] == PROVEN_WIN:
+                proven[parent] = PROVEN_LOSS
+            elif proven[node] == PROVEN_LOSS:
+                s = self.first_child[parent]
+                if not (proven[s:s + self.num_children[parent]] == PROVEN_LOSS).all():
+                    return
+                proven[parent] = PROVEN_WIN
+            else:
+                return
+
+    # --- SEARCH ---
+    def _selector(self, config, beta, widen):
+        uct_c = config["uct_c"]
+        puct_c = config.get("puct_c", PUCT_C)
+        solver = config.get("solver", False)
+        return lambda node: self._select(node, uct_c, beta, widen, puct_c, solver)
+
+    def _descend(self, board, root_player, radius, select, path, nodes, widen=None, solver=False):
+        """Selection + expansion; langkah dipasang di `board`, jalur dicatat di `path`/`nodes`.
+
+        Mengembalikan (mover, sim_result); sim_result None berarti perlu rollout.
+        """
+        opponent_of_root = PLAYER_X if root_player == PLAYER_O else PLAYER_O
+        node = 0
+        mover = root_player
+
+        # Selection: berhenti di anak yang belum pernah dikunjungi
+        while self.num_children[node] > 0:
+            node = select(node)
+            r, c = index_cell(int(self.move[node]))
+            board.place(r, c, mover)
+            path.append((r, c))
+            nodes.append(node)
+            mover = opponent_of_root if mover == root_player else root_player
+            if self.visits[node] == 0:
+                break
+
+        prev_player = opponent_of_root if mover == root_player else root_player
+        if path and board.wins_at(path[-1][0], path[-1][1], prev_player):
+            return mover, 1.0 if prev_player == PLAYER_O else 0.0
+
+        # Expansion: node yang sudah pernah dikunjungi mendapat blok anak
+        if self.num_children[node] == UNEXPANDED and (self.visits[node] > 0 or node == 0):
+            moves = expansion_moves(board, radius, mover, solver)
+            priors = None
+            if widen is not None and moves:
+                # Blok anak terurut prior menurun: k anak pertama yang terbuka
+                ranked = sorted(zip(move_priors(board, moves, mover), moves), reverse=True)
+                priors = [p for p, _ in ranked]
+                moves = [m for _, m in ranked]
+            first = self._expand(node, [cell_index(r, c) for r, c in moves], priors)
+            if moves:
+                r, c = moves[0]
+                board.place(r, c, mover)
+                path.append((r, c))
+                nodes.append(first)
+                prev_player, mover = mover, prev_player
+                if board.wins_at(r, c, prev_player):
+                    return mover, 1.0 if prev_player == PLAYER_O else 0.0
+        return mover, None
+
+    def search(self, board, config, root_player, num_simulations):
+        """Jalankan simulasi dari root (posisi `board`, giliran `root_player`).
+
+        Tiap iterasi memilih sampai config["batch_size"] daun (leaf
+        parallelisation). Setiap daun yang terpilih diberi virtual loss (visit
+        tambahan tanpa kemenangan, seberat config["virtual_loss"]) di
+        sepanjang jalurnya, sehingga seleksi berikutnya dalam batch yang sama
+        menyebar ke daun lain; rollout semua daun dijalankan sekaligus lalu
+        di-backprop. Dengan "solver", berhenti begitu nilai root terbukti.
+        Mengembalikan jumlah simulasi yang dijalankan.
+        """
+        board = board.copy()
+        radius = config["neighbor_radius"]
+        beta = rave_beta(config) if config.get("rave") else None
+        widen = widening_limit(config)
+        select = self._selector(config, beta, widen)
+        solver = config.get("solver", False)
+        batch_size = config.get("batch_size", 1)
+        virtual_loss = config.get("virtual_loss", 1)
+
+        done = 0
+        while done < num_simulations:
+            # Recycle memindahkan indeks node, jadi hanya boleh di antara batch;
+            # batch dipotong lebih awal jika kapasitas tidak cukup
+            if self.size + MAX_CHILDREN > self.capacity:
+                self.recycle()
+
+            leaves = []
+            jobs = []
+            for _ in range(min(batch_size, num_simulations - done)):
+                if self.size + MAX_CHILDREN > self.capacity or (solver and self.proven_values[0]):
+                    break
+                path = []
+                nodes = [0]
+                mover, sim_result = self._descend(board, root_player, radius, select, path, nodes, widen,
+                                                  solver)
+                if sim_result is None:
+                    jobs.append((board.copy(), mover))
+                elif solver:
+                    # Node terminal: langkah terakhir membuat lima
+                    self.proven_values[nodes[-1]] = PROVEN_WIN
+                    self._propagate_proof(nodes)
+                leaves.append((nodes, path, sim_result))
+                self.visits[nodes] += virtual_loss
+                for r, c in reversed(path):
+                    board.remove(r, c)
+
+            moves = [] if beta else None
+            results = iter(rollout_batch(jobs, config, moves))
+            moves = iter(moves or ())
+            for nodes, path, sim_result in leaves:
+                rollout_moves = []
+                if sim_result is None:
+                    sim_result = next(results)
+                    if beta:
+                        rollout_moves = next(moves)
+                reward = sim_result if root_player == PLAYER_O else 1.0 - sim_result
+                if beta:
+                    self._update_amaf(nodes, path, rollout_moves, reward)
+                # Backpropagation: indeks pada jalur selalu unik
+                self.visits[nodes] += 1 - virtual_loss
+                self.wins[nodes] += reward
+            done += len(leaves)
+            if not leaves:
+                break
+        return done
+
+    # --- ROOT ---
+    def root_children(self):
+        """List (move, visits, wins) untuk semua anak root."""
+        n = self.num_children[0]
+        if n <= 0:
+            return []
+        s = self.first_child[0]
+        return [
+            (index_cell(int(m)), int(v), float(w))
+            for m, v, w in zip(self.move[s:s + n], self.visits[s:s + n], self.wins[s:s + n])
+        ]
+
+    def best_move(self):
+        n = self.num_children[0]
+        if n <= 0:
+            return None
+        s = self.first_child[0]
+        # Langkah yang terbukti menang dulu; yang terbukti kalah hanya jika tidak ada pilihan lain
+        visits = self.visits[s:s + n].copy()
+        proven = self.proven_values[s:s + n]
+        if (proven == PROVEN_WIN).any():
+            visits[proven != PROVEN_WIN] = -1
+        elif not (proven == PROVEN_LOSS).all():
+            visits[proven == PROVEN_LOSS] = -1
+        return index_cell(int(self.move[s + int(visits.argmax())]))
+
+    def advance(self, move):
+        """Jadikan anak root dengan langkah `move` sebagai root baru; False jika tidak ada."""
+        n = self.num_children[0]
+        if n > 0:
+            s = self.first_child[0]
+            hits = np.flatnonzero(self.move[s:s + n] == cell_index(*move))
+            if hits.size:
+                self._compact(s + int(hits[0]))
+                return True
+        self.reset()
+        return False
+
+    # --- RECYCLING ---
+    def recycle(self):
+        """Lipat subtree dengan visit paling sedikit sampai separuh kapasitas bebas."""
+        target = int(self.capacity * RECYCLE_FRACTION)
+        used = self.size
+        parent = self.parent[:used].tolist()
+        sizes = [1] * used
+        for i in range(used - 1, 0, -1):
+            sizes[parent[i]] += sizes[i]
+
+        expanded = np.flatnonzero(self.num_children[1:used] > 0) + 1
+        order = expanded[np.argsort(self.visits[expanded], kind="stable")]
+        collapsed = set()
+        freed = 0
+        for n in order.tolist():
+            if freed >= used - (self.capacity - target):
+                break
+            collapsed.add(n)
+            freed += sizes[n] - 1
+        self._compact(0, collapsed)
+        self.recycles += 1
+
+    def _compact(self, new_root, collapsed=()):
+        # Salin node yang masih hidup (BFS dari new_root) ke awal array,
+        # blok anak tetap berurutan dan anak tetap sesudah parent-nya.
+        num_children = self.num_children.tolist()
+        first_child = self.first_child.tolist()
+        order = [new_root]
+        new_first = {}
+        i = 0
+        while i < len(order):
+            n = order[i]
+            i += 1
+            nc = num_children[n]
+            if nc > 0 and n not in collapsed:
+                new_first[n] = len(order)
+                order.extend(range(first_child[n], first_child[n] + nc))
+
+        old = np.array(order, dtype=np.int64)
+        m = len(order)
+        remap = np.full(self.capacity, -1, dtype=np.int32)
+        remap[old] = np.arange(m, dtype=np.int32)
+
+        self.visits[:m] = self.visits[old]
+        self.wins[:m] = self.wins[old]
+        self.amaf_visits[:m] = self.amaf_visits[old]
+        self.amaf_wins[:m] = self.amaf_wins[old]
+        self.prior[:m] = self.prior[old]
+        self.proven_values[:m] = self.proven_values[old]
+        self.move[:m] = self.move[old]
+        parent = remap[self.parent[old]]
+        parent[0] = -1
+        self.parent[:m] = parent
+        self.first_child[:m] = [new_first.get(n, -1) for n in order]
+        self.num_children[:m] = [num_children[n] if n in new_first else UNEXPANDED for n in order]
+
+        self.visits[m:self.size] = 0
+        self.wins[m:self.size] = 0
+        self.amaf_visits[m:self.size] = 0
+        self.amaf_wins[m:self.size] = 0
+        self.prior[m:self.size] = 0
+        self.proven_values[m:self.size] = 0
+        self.parent[m:self.size] = -1
+        self.first_child[m:self.size] = -1
+        self.num_children[m:self.size] = UNEXPANDED
+        self.move[m:self.size] = -1
+        self.size = m
+
+    def stats(self):
+        return {"nodes": self.size, "capacity": self.capacity, "recycles": self.recycles}
@@ -1,176 +1,343 @@
 import math
 import random
 import time
-import json
-import os
 
-def load_agent_config():
-    config_path = os.path.join(
-        os.path.dirname(__file__),
-        "config",
-        "agent_config.json"
-    )
-    with open(config_path, "r") as f:
-        return json.load(f)
-
-AGENT_CONFIG = load_agent_config()
+from agents.bitboard import SIDE_KEY, as_bitboard
+from agents.config_registry import get_minimax_level
+# SCORE_TABLE / evaluate_* tetap bisa diimpor dari modul ini seperti sebelumnya
+from agents.evaluation import (
+    SCORE_TABLE, IncrementalEvaluator, evaluate_bitboard, evaluate_board, evaluate_line,
+)
+from agents.frontier import Frontier
+from agents.move_ordering import MoveOrderer
+from agents.threat_search import DEFAULT_MAX_NODES, DEFAULT_TIME_MS, find_forced_win
+from agents.transposition import EXACT, LOWER, UPPER, TranspositionTable
 
 EMPTY = 0
 PLAYER_X = 1
 PLAYER_O = 2
 
-def get_minimax_config(level):
-    level_key = f"level_{level}"
-    return AGENT_CONFIG["minimax"].get(level_key, AGENT_CONFIG["minimax"]["level_1"])
-
-# --- EVALUASI POLA / SKOR ---
-SCORE_TABLE = {
-    (5, 0): 1000000, (5, 1): 1000000, (5, 2): 1000000,  # Menang
-    (4, 2): 100000,  # Live 4
-    (4, 1): 10000,   # Dead 4
-    (3, 2): 5000,    # Live 3
-    (3, 1): 100,     # Dead 3
-    (2, 2): 50,      # Live 2
-    (2, 1): 10,      # Dead 2
-    (1, 2): 5,
-    (1, 1): 1
-}
-
-
-# --- VALID MOVE (OPTIMIZED) ---
-def get_valid_moves_optimized(board, radius=2):
-    """Cari langkah-langkah di sekitar bidak yang sudah ada (mengurangi branching factor)."""
-    n = len(board)
-    moves = set()
-    has_piece = False
-
-    for r in range(n):
-        for c in range(n):
-            if board[r][c] != EMPTY:
-                has_piece = True
-                for i in range(max(0, r - radius), min(n, r + radius + 1)):
-                    for j in range(max(0, c - radius), min(n, c + radius + 1)):
-                        if board[i][j] == EMPTY:
-                            moves.add((i, j))
-
-    if not has_piece:
-        return [(n // 2, n // 2)]  # Langkah awal di tengah papan
-
-    return list(moves)
-
-
-# --- HITUNG SKOR PER GARIS ---
-def evaluate_line(line, player):
-    score = 0
-    i = 0
-    length = len(line)
-    while i < length:
-        if line[i] == player:
-            count = 0
-            start_idx = i
-            while i < length and line[i] == player:
-                count += 1
-                i += 1
-
-            open_ends = 0
-            if start_idx > 0 and line[start_idx - 1] == EMPTY:
-                open_ends += 1
-            if i < length and line[i] == EMPTY:
-                open_ends += 1
-
-            score += SCORE_TABLE.get((count, open_ends), 0)
-        else:
-            i += 1
-    return score
+TT_SIZE_BITS = 18
+MAX_ID_DEPTH = 12       # batas depth untuk level berbasis waktu tanpa "depth"
+TIME_CHECK_INTERVAL = 256   # cek deadline setiap N node
+ASPIRATION_WINDOW = 1000    # lebar awal aspiration window di sekitar skor iterasi sebelumnya
+ASPIRATION_GROWTH = 4       # faktor pelebaran window setiap kali gagal
 
+SEARCH_ALPHABETA = "alphabeta"
+SEARCH_PVS = "pvs"
 
-# --- HITUNG SKOR SELURUH PAPAN ---
-def evaluate_board(board, player, defense_weight=1.5):
-    n = len(board)
-    opponent = PLAYER_X if player == PLAYER_O else PLAYER_O
-    my_score, op_score = 0, 0
-
-    # Horizontal dan Vertikal
-    for i in range(n):
-        row = board[i]
-        col = [board[r][i] for r in range(n)]
-        my_score += evaluate_line(row, player)
-        op_score += evaluate_line(row, opponent)
-        my_score += evaluate_line(col, player)
-        op_score += evaluate_line(col, opponent)
-
-    # Diagonal \
-    for k in range(-n + 1, n):
-        diag = [board[r][r - k] for r in range(n) if 0 <= r - k < n]
-        if len(diag) >= 5:
-            my_score += evaluate_line(diag, player)
-            op_score += evaluate_line(diag, opponent)
-
-    # Diagonal /
-    for k in range(2 * n - 1):
-        diag = [board[r][k - r] for r in range(n) if 0 <= k - r < n]
-        if len(diag) >= 5:
-            my_score += evaluate_line(diag, player)
-            op_score += evaluate_line(diag, opponent)
-
-    # Lebih defensif — penalti lawan lebih besar
-    return my_score - (op_score * defense_weight)
+# Info pencarian terakhir (depth selesai, jumlah node, waktu), untuk logging/monitoring
+LAST_SEARCH_STATS = {}
 
+def get_minimax_config(level):
+    return get_minimax_level(level)
 
 # --- MINIMAX + ALPHA-BETA PRUNING ---
-def minimax_ab(board, depth, alpha, beta, is_maximizing, player, radius, defense_weight):
-    valid_moves = get_valid_moves_optimized(board, radius)
-    if depth == 0 or not valid_moves:
-        return evaluate_board(board, player, defense_weight), None
-
+class SearchTimeout(Exception):
+    """Dilempar dari dalam minimax_ab saat deadline SearchContext terlewati."""
+
+
+class SearchContext:
+    """State inkremental yang dibagi oleh seluruh node dalam satu pencarian.
+
+    Papan, frontier kandidat langkah dan evaluator selalu di-update bersama
+    lewat make/unmake, sehingga tidak ada yang perlu memindai ulang 225 sel.
+    """
+
+    def __init__(self, board, radius, tt=None, deadline=None, search=SEARCH_ALPHABETA):
+        self.board = board
+        self.frontier = Frontier.from_board(board, radius)
+        self.evaluator = IncrementalEvaluator(board)
+        self.tt = tt
+        self.deadline = deadline    # time.perf_counter() batas waktu, None = tanpa batas
+        self.nodes = 0
+        self.orderer = MoveOrderer()
+        self.ply = 0
+        self.pvs = search == SEARCH_PVS
+        self.re_searches = 0
+
+    def make(self, r, c, player):
+        self.board.place(r, c, player)
+        self.frontier.place(r, c)
+        self.evaluator.place(r, c, player)
+        self.ply += 1
+
+    def unmake(self, r, c):
+        self.ply -= 1
+        self.evaluator.undo(r, c)
+        self.frontier.undo(r, c)
+        self.board.remove(r, c)
+
+
+def minimax_ab(board, depth, alpha, beta, is_maximizing, player, radius, defense_weight, ctx=None):
+    """Alpha-beta di atas BitBoard; langkah dipasang lalu dicabut kembali (make/unmake).
+
+    `ctx` (SearchContext) dibuat otomatis jika tidak diberikan. Jika ctx.tt
+    diisi TranspositionTable, tabel dipakai untuk cutoff dan untuk mencoba
+    langkah terbaik yang tersimpan lebih dulu. Dengan mode "pvs", hanya langkah
+    pertama yang dicari dengan window penuh; langkah lain dicari dengan null
+    window dan baru dicari ulang jika ternyata lebih baik (principal variation search).
+    """
+    if ctx is None:
+        ctx = SearchContext(board, radius)
+    frontier = ctx.frontier
+    tt = ctx.tt
+
+    ctx.nodes += 1
+    if ctx.deadline is not None and not ctx.nodes % TIME_CHECK_INTERVAL:
+        if time.perf_counter() > ctx.deadline:
+            raise SearchTimeout()
+
+    alpha_orig, beta_orig = alpha, beta
+    hash_move = None
+    if tt is not None:
+        key = board.key if is_maximizing else board.key ^ SIDE_KEY
+        entry = tt.probe(key)
+        if entry is not None:
+            _, e_depth, flag, e_score, hash_move, _ = entry
+            if e_depth >= depth:
+                if flag == EXACT:
+                    return e_score, hash_move
+                if flag == LOWER:
+                    alpha = max(alpha, e_score)
+                else:
+                    beta = min(beta, e_score)
+                if beta <= alpha:
+                    return e_score, hash_move
+
+    # Daun: cukup cek mask frontier, tidak perlu membangun daftar langkah
+    if depth == 0 or (board.count and not frontier.mask):
+        score = ctx.evaluator.evaluate(player, defense_weight)
+        if tt is not None:
+            tt.store(key, depth, EXACT, score, None)
+        return score, None
     opponent = PLAYER_X if player == PLAYER_O else PLAYER_O
+    orderer = ctx.orderer
+    valid_moves = orderer.order(board, frontier.moves(), player if is_maximizing else opponent,
+                                ctx.ply, hash_move)
 
+    pvs = ctx.pvs
     if is_maximizing:
-        max_eval, best_move = -math.inf, random.choice(valid_moves)
-        for move in valid_moves:
+        max_eval, best_move = -math.inf, valid_moves[0]
+        for i, move in enumerate(valid_moves):
             r, c = move
-            board[r][c] = player
-            eval_val, _ = minimax_ab(board, depth - 1, alpha, beta, False, player, radius, defense_weight)
-            board[r][c] = EMPTY
+            ctx.make(r, c, player)
+            if pvs and i:
+                # Null window (alpha, alpha + ulp): cukup buktikan langkah ini tidak lebih baik
+                eval_val, _ = minimax_ab(board, depth - 1, alpha, math.nextafter(alpha, math.inf),
+                                         False, player, radius, defense_weight, ctx)
+                if alpha < eval_val < beta:
+                    # Fail high: eval_val sudah batas bawah, jadi cukup cari ulang di (eval_val, beta)
+                    ctx.re_searches += 1
+                    eval_val, _ = minimax_ab(board, depth - 1, eval_val, beta, False, player, radius,
+                                             defense_weight, ctx)
+            else:
+                eval_val, _ = minimax_ab(board, depth - 1, alpha, beta, False, player, radius, defense_weight, ctx)
+            ctx.unmake(r, c)
 
             if eval_val > max_eval:
                 max_eval, best_move = eval_val, move
 
             alpha = max(alpha, eval_val)
             if beta <= alpha:
+                orderer.record_cutoff(move, ctx.ply, depth, i)
                 break
-        return max_eval, best_move
+        best_eval = max_eval
     else:
-        min_eval, best_move = math.inf, random.choice(valid_moves)
-        for move in valid_moves:
+        min_eval, best_move = math.inf, valid_moves[0]
+        for i, move in enumerate(valid_moves):
             r, c = move
-            board[r][c] = opponent
-            eval_val, _ = minimax_ab(board, depth - 1, alpha, beta, True, player, radius, defense_weight)
-            board[r][c] = EMPTY
+            ctx.make(r, c, opponent)
+            if pvs and i:
+                eval_val, _ = minimax_ab(board, depth - 1, math.nextafter(beta, -math.inf), beta,
+                                         True, player, radius, defense_weight, ctx)
+                if alpha < eval_val < beta:
+                    ctx.re_searches += 1
+                    eval_val, _ = minimax_ab(board, depth - 1, alpha, eval_val, True, player, radius,
+                                             defense_weight, ctx)
+            else:
+                eval_val, _ = minimax_ab(board, depth - 1, alpha, beta, True, player, radius, defense_weight, ctx)
+            ctx.unmake(r, c)
 
             if eval_val < min_eval:
                 min_eval, best_move = eval_val, move
 
             beta = min(beta, eval_val)
             if beta <= alpha:
+                orderer.record_cutoff(move, ctx.ply, depth, i)
                 break
-        return min_eval, best_move
+        best_eval = min_eval
+
+    if tt is not None:
+        if best_eval <= alpha_orig:
+            flag = UPPER
+        elif best_eval >= beta_orig:
+            flag = LOWER
+        else:
+            flag = EXACT
+        tt.store(key, depth, flag, best_eval, best_move)
+    return best_eval, best_move
+
+
+# --- ITERATIVE DEEPENING DENGAN BATAS WAKTU ---
+def iterative_deepening(board, player, radius, defense_weight, time_ms, max_depth=MAX_ID_DEPTH, tt=None,
+                        search=SEARCH_ALPHABETA):
+    """Cari depth 1, 2, 3, ... sampai `time_ms` habis; kembalikan hasil depth terdalam yang selesai.
+
+    Urutan langkah dari iterasi sebelumnya dipakai ulang lewat `tt` (langkah
+    terbaik tersimpan dicoba lebih dulu di setiap node). Depth 1 selalu
+    diselesaikan supaya selalu ada langkah. Iterasi yang terpotong deadline
+    dibuang; papan yang dipakai adalah salinan sehingga `board` tidak berubah.
+    Dengan search="pvs", tiap iterasi dimulai dengan aspiration window di
+    sekitar skor iterasi sebelumnya dan dilebarkan jika skor jatuh di luarnya.
+    Mengembalikan (score, move, info).
+    """
+    start = time.perf_counter()
+    deadline = start + time_ms / 1000.0
+    if tt is None:
+        tt = TranspositionTable(TT_SIZE_BITS)
+    ctx = SearchContext(board.copy(), radius, tt, search=search)
+
+    best_score, best_move, completed = None, None, 0
+    scores = []     # skor per depth yang selesai, untuk tebakan aspiration window
+    aspiration_fails = 0
+    for depth in range(1, max_depth + 1):
+        if depth > 1:
+            ctx.deadline = deadline
+            if time.perf_counter() > deadline:
+                break
+        try:
+            if ctx.pvs and depth > 2:
+                # Skor berosilasi antara depth ganjil dan genap (giliran terakhir
+                # bergantian), jadi tebakan diambil dari depth dengan paritas sama
+                score, move, fails = aspiration_search(ctx, depth, scores[-2], player, radius,
+                                                       defense_weight)
+                aspiration_fails += fails
+            else:
+                score, move = minimax_ab(ctx.board, depth, -math.inf, math.inf, True, player, radius,
+                                         defense_weight, ctx)
+        except SearchTimeout:
+            break
+        best_score, best_move, completed = score, move, depth
+        scores.append(score)
+
+    info = {
+        "depth": completed,
+        "nodes": ctx.nodes,
+        "time_ms": (time.perf_counter() - start) * 1000.0,
+        "ordering": ctx.orderer.stats(),
+        "search": search,
+    }
+    if ctx.pvs:
+        info["re_searches"] = ctx.re_searches
+        info["aspiration_fails"] = aspiration_fails
+    return best_score, best_move, info
+
+
+def aspiration_search(ctx, depth, guess, player, radius, defense_weight):
+    """Cari root dengan window sempit di sekitar `guess`; lebarkan sisi yang gagal sampai skor masuk.
+
+    Mengembalikan (score, move, jumlah_gagal).
+    """
+    delta = ASPIRATION_WINDOW
+    alpha, beta = guess - delta, guess + delta
+    fails = 0
+    while True:
+        score, move = minimax_ab(ctx.board, depth, alpha, beta, True, player, radius,
+                                 defense_weight, ctx)
+        if score <= alpha:
+            alpha = -math.inf if score == -math.inf else score - delta
+        elif score >= beta:
+            beta = math.inf if score == math.inf else score + delta
+        else:
+            return score, move, fails
+        fails += 1
+        delta *= ASPIRATION_GROWTH
+
+
+# --- TABEL TRANSPOSISI PER KONFIGURASI ---
+# Skor bergantung pada player, radius dan defense_weight, jadi tiap kombinasi
+# punya tabel sendiri. Tabel dipakai ulang antar langkah dalam satu permainan.
+_TT_CACHE = {}
+
+
+def get_transposition_table(player, radius, defense_weight):
+    key = (player, radius, defense_weight)
+    if key not in _TT_CACHE:
+        _TT_CACHE[key] = TranspositionTable(TT_SIZE_BITS)
+    return _TT_CACHE[key]
 
 
 # --- UTAMA: DIPANGGIL DARI GUI ATAU SIMULASI ---
 def get_move_minimax_level(board, level=1):
     conf = get_minimax_config(level)
-    depth = conf["depth"]
     radius = conf["radius"]
     defense_weight = conf["defense_weight"]
 
+    board = as_bitboard(board)
     start = time.time()
+
+    # Cek menang paksa (VCF/VCT) dulu; jika terbukti, langsung mainkan
+    threat_time = min(DEFAULT_TIME_MS, conf["time_ms"] / 4) if "time_ms" in conf else DEFAULT_TIME_MS
+    win_move = find_forced_win(board, board.side_to_move(),
+                               conf.get("threat_nodes", DEFAULT_MAX_NODES), threat_time)
+    if win_move is not None:
+        LAST_SEARCH_STATS.clear()
+        LAST_SEARCH_STATS.update(level=level, forced_win=True, time_ms=(time.time() - start) * 1000.0)
+        return win_move
+
     ai_player = PLAYER_X
-    score, move = minimax_ab(board, depth, -math.inf, math.inf, True, ai_player, radius, defense_weight)
+    search = conf.get("search", SEARCH_ALPHABETA)
+    tt = get_transposition_table(ai_player, radius, defense_weight)
+    tt.new_search()
+    if "time_ms" in conf:
+        # Level berbasis waktu: "depth" (opsional) menjadi batas atas iterative deepening
+        depth = conf.get("depth", MAX_ID_DEPTH)
+        remaining_ms = max(conf["time_ms"] - (time.time() - start) * 1000.0, 1.0)
+        score, move, info = iterative_deepening(board, ai_player, radius, defense_weight,
+                                                remaining_ms, depth, tt, search)
+    elif conf.get("workers", 1) > 1:
+        # Root splitting ke beberapa proses (diimpor di sini karena modulnya mengimpor modul ini)
+        from agents.parallel_minimax import parallel_minimax
+        depth = conf["depth"]
+        score, move, info = parallel_minimax(board, depth, ai_player, radius, defense_weight,
+                                             conf["workers"], tt)
+        info["depth"] = depth
+    else:
+        depth = conf["depth"]
+        ctx = SearchContext(board, radius, tt, search=search)
+        score, move = minimax_ab(board, depth, -math.inf, math.inf, True, ai_player, radius, defense_weight, ctx)
+        info = {"depth": depth, "nodes": ctx.nodes, "ordering": ctx.orderer.stats(), "search": search}
     end = time.time()
+    info["time_ms"] = (end - start) * 1000.0
+    LAST_SEARCH_STATS.clear()
+    LAST_SEARCH_STATS.update(info, level=level, forced_win=False, tt=tt.stats())
 
     # print(f"[Minimax Lv{level}] Time: {end - start:.3f}s | Depth={depth} | Radius={radius} | Move={move}")
     if move is None:
-        valid = get_valid_moves_optimized(board)
+        valid = board.candidate_moves(2)
         return random.choice(valid) if valid else (0, 0)
-    return move
\ No newline at end of file
+    return move
+
+# --- BENCHMARK: ALPHA-BETA VS PVS ---
+def benchmark_search_modes(boards, player=PLAYER_X, radius=2, defense_weight=1.5, max_depth=4):
+    """Jumlah node dan waktu iterative deepening per mode pencarian, dijumlah atas `boards`."""
+    totals = {}
+    for search in (SEARCH_ALPHABETA, SEARCH_PVS):
+        nodes = elapsed = 0
+        for b in boards:
+            tt = TranspositionTable(TT_SIZE_BITS)
+            _, _, info = iterative_deepening(as_bitboard(b), player, radius, defense_weight,
+                                             math.inf, max_depth, tt, search)
+            nodes += info["nodes"]
+            elapsed += info["time_ms"]
+        totals[search] = {"nodes": nodes, "time_ms": elapsed}
+    return totals
+
+
+if __name__ == "__main__":
+    from agents.mcts_benchmark import random_positions
+
+    bench_boards = [board for stones in (6, 12, 20) for board in random_positions(2, stones, seed=7)]
+    for search, row in benchmark_search_modes(bench_boards).items():
+        print(f"{search:>10}: {row['nodes']:>8} nodes  {row['time_ms']:>9.0f} ms")
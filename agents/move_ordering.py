@@ -0,0 +1,82 @@
+from agents.bitboard import NUM_BITS, PLAYER_X, PLAYER_O, cell_index
+from agents.threats import five_moves, four_moves, open_three_moves
+
+# ==============================
+# PRIORITY TIERS
+# ==============================
+TIER_HASH = 7           # langkah terbaik dari transposition table
+TIER_WIN = 6            # langsung lima
+TIER_BLOCK_FIVE = 5     # menutup four lawan
+TIER_FOUR = 4           # membuat four sendiri
+TIER_OPEN_THREE = 3     # membuat open three sendiri
+TIER_KILLER = 2         # killer move pada ply yang sama
+TIER_QUIET = 0          # sisanya, diurutkan dengan history table
+
+MAX_PLY = 64
+
+
+class MoveOrderer:
+    """Urutan langkah untuk alpha-beta: ancaman dulu, lalu killer, lalu history.
+
+    Juga mencatat statistik cutoff, termasuk berapa kali cutoff terjadi pada
+    langkah pertama (indikator kualitas urutan langkah).
+    """
+
+    def __init__(self):
+        self.killers = [[None, None] for _ in range(MAX_PLY)]
+        self.history = [0] * NUM_BITS
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+
+    def order(self, board, moves, mover, ply, hash_move=None):
+        opponent = PLAYER_X if mover == PLAYER_O else PLAYER_O
+        own = board.bits(mover)
+        opp = board.bits(opponent)
+        empty = board.empty
+        win = five_moves(own, empty)
+        block = five_moves(opp, empty)
+        four = four_moves(own, empty)
+        three = open_three_moves(own, empty)
+        killers = self.killers[ply] if ply < MAX_PLY else ()
+        history = self.history
+
+        scored = []
+        for move in moves:
+            idx = cell_index(*move)
+            if move == hash_move:
+                tier = TIER_HASH
+            elif win >> idx & 1:
+                tier = TIER_WIN
+            elif block >> idx & 1:
+                tier = TIER_BLOCK_FIVE
+            elif four >> idx & 1:
+                tier = TIER_FOUR
+            elif three >> idx & 1:
+                tier = TIER_OPEN_THREE
+            elif move in killers:
+                tier = TIER_KILLER
+            else:
+                tier = TIER_QUIET
+            scored.append((tier, history[idx], move))
+        scored.sort(reverse=True)
+        return [move for _, _, move in scored]
+
+    def record_cutoff(self, move, ply, depth, move_number):
+        self.cutoffs += 1
+        if move_number == 0:
+            self.first_move_cutoffs += 1
+        if ply < MAX_PLY:
+            killers = self.killers[ply]
+            if killers[0] != move:
+                killers[1] = killers[0]
+                killers[0] = move
+        self.history[cell_index(*move)] += depth * depth
+
+    def stats(self):
+        return {
+            "cutoffs": self.cutoffs,
+            "first_move_cutoffs": self.first_move_cutoffs,
+            "first_move_cutoff_rate": (
+                self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0.0
+            ),
+        }
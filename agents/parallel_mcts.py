@@ -0,0 +1,141 @@
+import random
+import time
+
+from agents.bitboard import BitBoard
+from agents.mcts_optimized_agent import make_tree, simulate_rollout
+from agents.process_pool import default_worker_counts, get_pool
+
+CHUNK = 32      # simulasi per potongan saat worker memakai batas waktu
+
+# ==============================
+# WORKER TASK
+# ==============================
+def _grow_tree(x_bits, o_bits, config, root_player, num_simulations, time_ms, seed):
+    """Bangun satu pohon independen; kembalikan (statistik anak root, jumlah simulasi)."""
+    random.seed(seed)
+    board = BitBoard(x_bits, o_bits)
+    tree = make_tree(config)
+    if time_ms:
+        deadline = time.perf_counter() + time_ms / 1000.0
+        done = 0
+        # Potongan pertama selalu dijalankan supaya root punya anak
+        while not done or (time.perf_counter() < deadline and tree.proven is None):
+            done += tree.search(board, config, root_player, CHUNK)
+    else:
+        done = tree.search(board, config, root_player, num_simulations)
+    return tree.root_children(), done
+
+
+def _rollout_chunk(jobs, config, seed, record_moves):
+    random.seed(seed)
+    results = []
+    moves = []
+    for x_bits, o_bits, mover in jobs:
+        job_moves = [] if record_moves else None
+        results.append(simulate_rollout(BitBoard(x_bits, o_bits), mover, config, job_moves))
+        moves.append(job_moves)
+    return results, moves
+
+
+# ==============================
+# BATCHED ROLLOUTS (LEAF PARALLEL)
+# ==============================
+def parallel_rollouts(jobs, config, workers, moves=None):
+    """Rollout untuk list (board, mover) dibagi ke pool; urutan hasil sama dengan `jobs`.
+
+    Jika `moves` diberikan (list), daftar langkah tiap rollout ditambahkan ke sana.
+    """
+    pool = get_pool(workers)
+    config = dict(config)
+    packed = [(b.x_bits, b.o_bits, mover) for b, mover in jobs]
+    size = -(-len(packed) // workers)
+    futures = [
+        pool.submit(_rollout_chunk, packed[i:i + size], config, random.getrandbits(32),
+                    moves is not None)
+        for i in range(0, len(packed), size)
+    ]
+    results = []
+    for future in futures:
+        chunk_results, chunk_moves = future.result()
+        results += chunk_results
+        if moves is not None:
+            moves += chunk_moves
+    return results
+
+
+# ==============================
+# ROOT-PARALLEL SEARCH
+# ==============================
+def parallel_mcts(board, config, root_player, workers, time_ms=None, seed=None):
+    """Root parallelisation: `workers` pohon dari root yang sama dengan seed berbeda.
+
+    Dengan `time_ms`, setiap worker mensimulasikan sampai batas waktu (total
+    simulasi naik sebanding jumlah core). Tanpa `time_ms`,
+    config["num_simulations"] dibagi rata ke semua worker. Visit dan win anak
+    root dijumlahkan; langkah dengan visit terbanyak dipilih.
+    Mengembalikan (move, stats).
+    """
+    start = time.perf_counter()
+    pool = get_pool(workers)
+    config = dict(config)   # level dari registry (mappingproxy) tidak bisa di-pickle
+    if seed is None:
+        seed = random.getrandbits(32)
+    per_worker = -(-config["num_simulations"] // workers)
+
+    futures = [
+        pool.submit(_grow_tree, board.x_bits, board.o_bits, config, root_player,
+                    per_worker, time_ms, seed + i)
+        for i in range(workers)
+    ]
+    merged = {}
+    simulations = 0
+    for future in futures:
+        children, done = future.result()
+        simulations += done
+        for move, visits, wins in children:
+            v, w = merged.get(move, (0, 0.0))
+            merged[move] = (v + visits, w + wins)
+
+    elapsed = time.perf_counter() - start
+    stats = {
+        "workers": workers,
+        "simulations": simulations,
+        "time_ms": elapsed * 1000.0,
+        "simulations_per_sec": simulations / elapsed if elapsed else 0.0,
+    }
+    if not merged:
+        return None, stats
+    move = max(merged, key=lambda m: merged[m][0])
+    return move, stats
+
+
+# ==============================
+# SCALING BENCHMARK
+# ==============================
+def benchmark_scaling(board, config, time_ms=1000, worker_counts=None):
+    """Total simulasi per detik untuk tiap jumlah worker dengan batas waktu tetap."""
+    if worker_counts is None:
+        worker_counts = default_worker_counts()
+    player = board.side_to_move()
+    rows = []
+    base = None
+    for workers in worker_counts:
+        parallel_mcts(board, config, player, workers, time_ms=50)   # pemanasan pool
+        _, stats = parallel_mcts(board, config, player, workers, time_ms=time_ms)
+        if base is None:
+            base = stats["simulations"]
+        rows.append((workers, stats["simulations"], stats["simulations_per_sec"],
+                     stats["simulations"] / base))
+    return rows
+
+
+if __name__ == "__main__":
+    from agents.config_registry import get_mcts_level
+    from agents.mcts_benchmark import random_positions
+
+    bench_board = random_positions(1, stones=12)[0]
+    bench_config = get_mcts_level("mcts_hard")
+
+    print(f"{'workers':>8} {'sims':>8} {'sims/s':>9} {'scaling':>8}")
+    for workers, sims, rate, scaling in benchmark_scaling(bench_board, bench_config):
+        print(f"{workers:>8} {sims:>8} {rate:>9.0f} {scaling:>8.2f}")
@@ -0,0 +1,171 @@
+import math
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+
+from agents.bitboard import BitBoard, PLAYER_X
+from agents.frontier import Frontier
+from agents.move_ordering import MoveOrderer
+from agents import minimax_optimized_agent as minimax
+from agents import process_pool
+from agents.process_pool import default_worker_counts
+
+# ==============================
+# SHARED ALPHA
+# ==============================
+# Satu alpha bersama untuk semua pool minimax, diberikan ke worker lewat
+# initializer (agents.process_pool); dibuat sekali supaya pool yang sudah
+# ada tetap memegang Value yang sama.
+_SHARED_ALPHA = None
+_search_id = 0          # naik setiap parallel_minimax, supaya worker tahu ada pencarian root baru
+
+# Di dalam proses worker: alpha bersama yang diberikan lewat initializer, dan
+# id pencarian terakhir per transposition table (untuk new_search)
+_worker_alpha = None
+_worker_searches = {}
+
+
+def _init_worker(shared_alpha):
+    global _worker_alpha
+    _worker_alpha = shared_alpha
+
+
+def get_pool(workers):
+    global _SHARED_ALPHA
+    if _SHARED_ALPHA is None:
+        _SHARED_ALPHA = multiprocessing.Value("d", -math.inf)
+    return process_pool.get_pool(workers, _init_worker, (_SHARED_ALPHA,))
+
+
+# ==============================
+# WORKER TASK
+# ==============================
+def _search_root_move(x_bits, o_bits, move, depth, player, radius, defense_weight, search_id):
+    """Cari satu langkah root di worker.
+
+    Alpha bersama hanya dibaca sekali saat tugas dimulai dan dipakai sebagai
+    alpha awal subtree; kenaikan alpha dari worker lain selama subtree ini
+    dicari tidak ikut memangkasnya. Skor akhir menaikkan alpha bersama untuk
+    tugas-tugas berikutnya.
+    """
+    board = BitBoard(x_bits, o_bits)
+    # Transposition table per worker, tetap hidup antar langkah; age dinaikkan
+    # sekali per pencarian root supaya entri lama bisa diganti
+    key = (player, radius, defense_weight)
+    tt = minimax.get_transposition_table(player, radius, defense_weight)
+    if _worker_searches.get(key) != search_id:
+        _worker_searches[key] = search_id
+        tt.new_search()
+    ctx = minimax.SearchContext(board, radius, tt)
+
+    # Sedikit di bawah alpha bersama, supaya langkah yang nilainya sama dengan
+    # alpha tetap mendapat skor eksak (tie-break harus sama dengan versi serial)
+    alpha = math.nextafter(_worker_alpha.value, -math.inf)
+    r, c = move
+    ctx.make(r, c, player)
+    score, _ = minimax.minimax_ab(board, depth - 1, alpha, math.inf, False, player, radius,
+                                  defense_weight, ctx)
+    ctx.unmake(r, c)
+
+    with _worker_alpha.get_lock():
+        if score > _worker_alpha.value:
+            _worker_alpha.value = score
+    return score, ctx.nodes
+
+
+# ==============================
+# PARALLEL ROOT SEARCH
+# ==============================
+def order_root_moves(board, player, radius, tt=None):
+    frontier = Frontier.from_board(board, radius)
+    hash_move = None
+    if tt is not None:
+        entry = tt.probe(board.key)
+        if entry is not None:
+            hash_move = entry[4]
+    return MoveOrderer().order(board, frontier.moves(), player, 0, hash_move)
+
+
+def parallel_minimax(board, depth, player, radius, defense_weight, workers, tt=None):
+    """Root splitting dengan Young-Brothers-Wait di atas ProcessPoolExecutor.
+
+    Langkah root pertama (urutan terbaik) dicari dulu untuk mendapat alpha,
+    lalu sisanya dibagi ke worker dengan alpha bersama yang terus naik
+    (dibaca di awal setiap tugas, lihat _search_root_move).
+    Langkah dengan skor tertinggi dipilih; jika seri, yang lebih awal dalam
+    urutan root, sama seperti minimax_ab serial. Mengembalikan (score, move, info).
+    """
+    start = time.perf_counter()
+    moves = order_root_moves(board, player, radius, tt)
+    if depth <= 0 or not moves:
+        return minimax.minimax_ab(board, depth, -math.inf, math.inf, True, player, radius,
+                                  defense_weight) + ({"workers": 1, "nodes": 0},)
+
+    global _search_id
+    pool = get_pool(workers)
+    _SHARED_ALPHA.value = -math.inf
+    _search_id += 1
+    args = (board.x_bits, board.o_bits)
+
+    results = {}
+    nodes = 0
+    # Eldest brother dulu
+    score, n = pool.submit(_search_root_move, *args, moves[0], depth, player, radius,
+                           defense_weight, _search_id).result()
+    results[0] = score
+    nodes += n
+
+    pending = {
+        pool.submit(_search_root_move, *args, move, depth, player, radius, defense_weight,
+                    _search_id): i
+        for i, move in enumerate(moves[1:], start=1)
+    }
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            score, n = future.result()
+            results[pending.pop(future)] = score
+            nodes += n
+
+    best_index = max(results, key=lambda i: (results[i], -i))
+    info = {
+        "workers": workers,
+        "nodes": nodes,
+        "time_ms": (time.perf_counter() - start) * 1000.0,
+    }
+    return results[best_index], moves[best_index], info
+
+
+# ==============================
+# SCALING BENCHMARK
+# ==============================
+def benchmark_scaling(board, depths=(3, 4), worker_counts=None, player=PLAYER_X, radius=2,
+                      defense_weight=1.5):
+    """Ukur waktu dan speedup parallel_minimax terhadap minimax_ab serial."""
+    if worker_counts is None:
+        worker_counts = default_worker_counts()
+    rows = []
+    for depth in depths:
+        t0 = time.perf_counter()
+        serial_score, serial_move = minimax.minimax_ab(board.copy(), depth, -math.inf, math.inf, True,
+                                                       player, radius, defense_weight)
+        serial_time = time.perf_counter() - t0
+        rows.append((depth, "serial", serial_time, 1.0, True))
+        for workers in worker_counts:
+            get_pool(workers)   # spawn di luar pengukuran
+            t0 = time.perf_counter()
+            score, move, _ = parallel_minimax(board, depth, player, radius, defense_weight, workers)
+            elapsed = time.perf_counter() - t0
+            rows.append((depth, workers, elapsed, serial_time / elapsed,
+                         move == serial_move and score == serial_score))
+    return rows
+
+
+if __name__ == "__main__":
+    from agents.mcts_benchmark import random_positions
+
+    bench_board = random_positions(1, stones=20)[0]
+
+    print(f"{'depth':>5} {'workers':>8} {'time (s)':>9} {'speedup':>8} {'same':>5}")
+    for depth, workers, elapsed, speedup, same in benchmark_scaling(bench_board):
+        print(f"{depth:>5} {workers:>8} {elapsed:>9.2f} {speedup:>8.2f} {str(same):>5}")
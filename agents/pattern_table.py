@@ -0,0 +1,73 @@
+EMPTY = 0
+PLAYER_X = 1
+PLAYER_O = 2
+WALL = 3    # sel di luar garis: bukan kosong dan bukan milik siapa pun
+
+# ==============================
+# 2-BIT PACKED LINE ENCODING
+# ==============================
+# Setiap sel garis = 2 bit (EMPTY/PLAYER_X/PLAYER_O/WALL). Garis diberi WALL di
+# kedua ujung, jadi sel ke-i garis ada di digit ke-(i + 1).
+MAX_LINE = 15
+WINDOW = 7                      # sel sebelum run + 5 sel run + 1 sel sesudahnya
+WINDOW_MASK = (1 << (2 * WINDOW)) - 1
+
+# SPREAD[m] menyisipkan nol di antara bit-bit m (bit i -> bit 2i)
+SPREAD = [0] * (1 << MAX_LINE)
+for _m in range(1, 1 << MAX_LINE):
+    _low = _m & -_m
+    SPREAD[_m] = SPREAD[_m ^ _low] | (_low * _low)
+
+
+def encode_line(length, x_line, o_line):
+    code = SPREAD[x_line] | (SPREAD[o_line] << 1)
+    return WALL | (code << 2) | (WALL << (2 * (length + 1)))
+
+
+# ==============================
+# WINDOW SCORE TABLE
+# ==============================
+def build_window_table(score_table):
+    """Skor run yang dimulai di digit ke-1 setiap window 7 sel.
+
+    Digit 0 adalah sel sebelum run. Window hanya bernilai jika digit 1 dimiliki
+    pemain dan digit 0 tidak (awal run). Run yang panjangnya >= 6 bernilai 0,
+    sama seperti SCORE_TABLE.get di evaluate_line.
+    """
+    table = [0] * (1 << (2 * WINDOW))
+    for code in range(len(table)):
+        digits = [(code >> (2 * i)) & 3 for i in range(WINDOW)]
+        owner = digits[1]
+        if owner not in (PLAYER_X, PLAYER_O) or digits[0] == owner:
+            continue
+        length = 1
+        while length < WINDOW - 1 and digits[1 + length] == owner:
+            length += 1
+        if length >= WINDOW - 1:
+            continue
+        open_ends = (digits[0] == EMPTY) + (digits[1 + length] == EMPTY)
+        table[code] = score_table.get((length, open_ends), 0)
+    return table
+
+
+class PatternScorer:
+    """Skor garis lewat lookup tabel: satu lookup per run, kedua pemain sekaligus."""
+
+    def __init__(self, score_table):
+        self.window_scores = build_window_table(score_table)
+
+    def score_line(self, length, x_line, o_line):
+        code = encode_line(length, x_line, o_line)
+        table = self.window_scores
+        x_score = o_score = 0
+        starts = x_line & ~(x_line << 1)
+        while starts:
+            low = starts & -starts
+            x_score += table[(code >> (2 * (low.bit_length() - 1))) & WINDOW_MASK]
+            starts ^= low
+        starts = o_line & ~(o_line << 1)
+        while starts:
+            low = starts & -starts
+            o_score += table[(code >> (2 * (low.bit_length() - 1))) & WINDOW_MASK]
+            starts ^= low
+        return x_score, o_score
@@ -0,0 +1,37 @@
+import atexit
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# ==============================
+# PERSISTENT WORKER POOLS
+# ==============================
+# Pool dibuat sekali per (jumlah worker, initializer) dan dipakai ulang antar
+# langkah supaya biaya spawn proses tidak dibayar di setiap langkah. Pemanggil
+# dengan jumlah worker berbeda (mis. root-parallel MCTS dan rollout_workers,
+# atau dua level yang bergantian) masing-masing tetap memakai pool-nya sendiri.
+_POOLS = {}
+
+
+def get_pool(workers, initializer=None, initargs=()):
+    """Pool `workers` proses; `initializer`/`initargs` hanya dipakai saat pool pertama dibuat."""
+    key = (workers, initializer)
+    pool = _POOLS.get(key)
+    if pool is None:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs)
+        _POOLS[key] = pool
+    return pool
+
+
+def shutdown_pools():
+    for pool in _POOLS.values():
+        pool.shutdown(cancel_futures=True)
+    _POOLS.clear()
+
+
+atexit.register(shutdown_pools)
+
+
+def default_worker_counts():
+    """Jumlah worker untuk benchmark scaling: 1, 2, 4, ... sampai jumlah core."""
+    cpu = os.cpu_count() or 1
+    return [w for w in (1, 2, 4, 8, 16, 32) if w <= cpu]
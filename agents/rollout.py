@@ -0,0 +1,308 @@
+import random
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+
+from agents.bitboard import (
+    BOARD_SIZE, CENTER, EMPTY, NUM_BITS, PLAYER_X, PLAYER_O, STRIDE, cell_index, index_cell, iter_indices,
+)
+from agents.frontier import neighbour_table
+
+# ==============================
+# GEOMETRY
+# ==============================
+# Papan sel dalam bytearray dengan padding di kedua sisi, supaya cek lima di
+# sekitar langkah terakhir tidak perlu cek batas. Kolom penjaga (c = 15)
+# selalu 0, jadi langkah horizontal/diagonal tidak bocor ke baris lain.
+_PAD = 5 * (STRIDE + 1)
+_STEPS = (1, STRIDE, STRIDE + 1, STRIDE - 1)
+
+OCCUPIED = -2       # penanda di array posisi kandidat
+NOT_CANDIDATE = -1
+
+WALL = 3            # sel di luar papan (padding dan kolom penjaga) pada papan pola
+
+
+# ==============================
+# ROLLOUT ENGINE
+# ==============================
+class RolloutEngine:
+    """Playout acak cepat untuk MCTS.
+
+    Kandidat langkah (sel kosong dalam `radius` dari bidak mana pun) disimpan
+    dalam list plus array posisi, sehingga memilih dan menghapus kandidat acak
+    O(1) (tukar dengan elemen terakhir). Tetangga sel baru diambil dari tabel
+    yang dihitung sekali, dan cek menang hanya di sekitar langkah terakhir.
+    """
+
+    def __init__(self, radius):
+        self.radius = radius
+        self.table = neighbour_table(radius)
+
+    def run(self, board, player, max_steps, rng=random.random, moves=None):
+        """Mainkan sampai `max_steps` langkah dari `board` (tidak diubah).
+
+        Mengembalikan 1.0 jika O menang, 0.0 jika X menang, 0.5 jika tidak ada pemenang.
+        Jika `moves` diberikan (list), indeks bit setiap langkah ditambahkan ke sana.
+        """
+        table = self.table
+        cells = bytearray(_PAD + NUM_BITS + _PAD)
+        pos = [NOT_CANDIDATE] * NUM_BITS
+        for idx in iter_indices(board.x_bits):
+            cells[_PAD + idx] = PLAYER_X
+            pos[idx] = OCCUPIED
+        for idx in iter_indices(board.o_bits):
+            cells[_PAD + idx] = PLAYER_O
+            pos[idx] = OCCUPIED
+
+        if board.count:
+            cand = list(iter_indices(board.neighbourhood(self.radius)))
+        else:
+            cand = [cell_index(*CENTER)]
+        for i, idx in enumerate(cand):
+            pos[idx] = i
+
+        curr = player
+        for _ in range(max_steps):
+            n = len(cand)
+            if not n:
+                break
+
+            # Pilih acak lalu hapus dengan menukar elemen terakhir ke posisinya
+            i = int(rng() * n)
+            idx = cand[i]
+            last = cand.pop()
+            if last != idx:
+                cand[i] = last
+                pos[last] = i
+            pos[idx] = OCCUPIED
+            cells[_PAD + idx] = curr
+            if moves is not None:
+                moves.append(idx)
+
+            if _wins_at(cells, _PAD + idx, curr):
+                return 1.0 if curr == PLAYER_O else 0.0
+
+            for nb in table[idx]:
+                if pos[nb] == NOT_CANDIDATE:
+                    pos[nb] = len(cand)
+                    cand.append(nb)
+
+            curr = PLAYER_X if curr == PLAYER_O else PLAYER_O
+
+        return 0.5
+
+
+def _wins_at(cells, at, player):
+    for s in _STEPS:
+        count = 1
+        i = at + s
+        while cells[i] == player:
+            count += 1
+            i += s
+        i = at - s
+        while cells[i] == player:
+            count += 1
+            i -= s
+        if count >= 5:
+            return True
+    return False
+
+
+# ==============================
+# PATTERN ROLLOUT POLICY
+# ==============================
+# Bonus bobot untuk sel segaris dengan sebuah bidak pada jarak 1, 2
+PATTERN_WEIGHTS = (4, 2)
+BASE_WEIGHT = 1
+
+NO_THREAT = 0
+OPEN_FOUR = 1
+FIVE = 2
+
+@lru_cache(maxsize=None)
+def _walled_cells():
+    # Papan kosong berpadding dengan WALL di luar papan, supaya ujung garis
+    # di tepi papan tidak terbaca sebagai sel kosong
+    cells = bytearray([WALL]) * (_PAD + NUM_BITS + _PAD)
+    for r in range(BOARD_SIZE):
+        for c in range(BOARD_SIZE):
+            cells[_PAD + cell_index(r, c)] = EMPTY
+    return bytes(cells)
+
+
+@lru_cache(maxsize=None)
+def pattern_table():
+    """Untuk setiap indeks sel: tuple (indeks sel segaris, bonus) dalam jarak len(PATTERN_WEIGHTS)."""
+    table = []
+    for idx in range(NUM_BITS):
+        r, c = index_cell(idx)
+        entries = []
+        if c < BOARD_SIZE:
+            for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1), (0, -1), (-1, 0), (-1, -1), (-1, 1)):
+                for d, bonus in enumerate(PATTERN_WEIGHTS, 1):
+                    rr, cc = r + dr * d, c + dc * d
+                    if 0 <= rr < BOARD_SIZE and 0 <= cc < BOARD_SIZE:
+                        entries.append((cell_index(rr, cc), bonus))
+        table.append(tuple(entries))
+    return table
+
+
+def _line_threat(cells, at, step, player):
+    # Ancaman jika `player` bermain di sel kosong `at` pada arah `step`
+    lo = at - step
+    while cells[lo] == player:
+        lo -= step
+    hi = at + step
+    while cells[hi] == player:
+        hi += step
+    n = (hi - lo) // step - 1
+    if n >= 5:
+        return FIVE
+    if n == 4 and cells[lo] == EMPTY and cells[hi] == EMPTY:
+        return OPEN_FOUR
+    return NO_THREAT
+
+
+def _scan_threats(cells, at, player, fives, fours):
+    # Ancaman baru milik `player` harus memuat langkah `at` dalam barisnya,
+    # jadi per arah hanya sel pertama yang bukan bidaknya di kedua sisi yang
+    # perlu dicek. Five butuh 4 bidak dan open four 3 bidak dalam jendela 9 sel.
+    for s in _STEPS:
+        if cells[at - 4 * s:at + 5 * s:s].count(player) < 3:
+            continue
+        for step in (s, -s):
+            e = at + step
+            while cells[e] == player:
+                e += step
+            if cells[e] == EMPTY:
+                threat = _line_threat(cells, e, s, player)
+                if threat == FIVE:
+                    fives.append(e)
+                elif threat == OPEN_FOUR:
+                    fours.append((e, s))
+
+
+def _live_five(cells, fives):
+    for e in fives:
+        if cells[e] == EMPTY:
+            return e
+    return -1
+
+
+def _live_four(cells, fours, player):
+    # Open four bisa hilang jika ujungnya diisi lawan, jadi dicek ulang
+    for e, s in fours:
+        if cells[e] == EMPTY and _line_threat(cells, e, s, player) != NO_THREAT:
+            return e
+    return -1
+
+
+class PatternRolloutEngine:
+    """Playout dengan kebijakan berbasis ancaman.
+
+    Urutan tiap langkah: selesaikan five sendiri, blok five lawan (four
+    lawan), buat open four sendiri, blok open three lawan (sel yang akan
+    menjadi open four-nya). Sel ancaman setiap pemain dicatat secara
+    inkremental di sekitar langkahnya. Jika tidak ada ancaman, langkah
+    diambil acak dengan bobot BASE_WEIGHT + bonus dari pattern_table untuk
+    setiap bidak segaris di dekatnya.
+    """
+
+    def __init__(self, radius):
+        self.radius = radius
+        self.table = neighbour_table(radius)
+        self.patterns = pattern_table()
+
+    def run(self, board, player, max_steps, rng=random.random, moves=None):
+        """Sama dengan RolloutEngine.run, dengan pemilihan langkah berbasis pola."""
+        table = self.table
+        patterns = self.patterns
+        cells = bytearray(_walled_cells())
+        pos = [NOT_CANDIDATE] * NUM_BITS
+        bonus = [0] * NUM_BITS
+        fives = {PLAYER_X: [], PLAYER_O: []}
+        fours = {PLAYER_X: [], PLAYER_O: []}
+        stones = [(idx, PLAYER_X) for idx in iter_indices(board.x_bits)]
+        stones += [(idx, PLAYER_O) for idx in iter_indices(board.o_bits)]
+        for idx, owner in stones:
+            cells[_PAD + idx] = owner
+            pos[idx] = OCCUPIED
+            for nb, b in patterns[idx]:
+                bonus[nb] += b
+        for idx, owner in stones:
+            _scan_threats(cells, _PAD + idx, owner, fives[owner], fours[owner])
+
+        if board.count:
+            cand = list(iter_indices(board.neighbourhood(self.radius)))
+        else:
+            cand = [cell_index(*CENTER)]
+        weights = [BASE_WEIGHT + bonus[idx] for idx in cand]
+        for i, idx in enumerate(cand):
+            pos[idx] = i
+
+        curr = player
+        for _ in range(max_steps):
+            n = len(cand)
+            if not n:
+                break
+            opp = PLAYER_X if curr == PLAYER_O else PLAYER_O
+
+            at = _live_five(cells, fives[curr])
+            if at < 0:
+                at = _live_five(cells, fives[opp])
+            if at < 0:
+                at = _live_four(cells, fours[curr], curr)
+            if at < 0:
+                at = _live_four(cells, fours[opp], opp)
+            if at >= 0:
+                idx = at - _PAD
+                i = pos[idx]
+            else:
+                acc = list(accumulate(weights))
+                i = bisect_right(acc, rng() * acc[-1])
+                idx = cand[i]
+
+            # Hapus dari kandidat dengan menukar elemen terakhir ke posisinya
+            if i >= 0:
+                last = cand.pop()
+                last_w = weights.pop()
+                if last != idx:
+                    cand[i] = last
+                    weights[i] = last_w
+                    pos[last] = i
+            pos[idx] = OCCUPIED
+            cells[_PAD + idx] = curr
+            if moves is not None:
+                moves.append(idx)
+
+            if _wins_at(cells, _PAD + idx, curr):
+                return 1.0 if curr == PLAYER_O else 0.0
+
+            for nb in table[idx]:
+                if pos[nb] == NOT_CANDIDATE:
+                    pos[nb] = len(cand)
+                    cand.append(nb)
+                    weights.append(BASE_WEIGHT + bonus[nb])
+            for nb, b in patterns[idx]:
+                bonus[nb] += b
+                j = pos[nb]
+                if j >= 0:
+                    weights[j] += b
+            _scan_threats(cells, _PAD + idx, curr, fives[curr], fours[curr])
+
+            curr = opp
+
+        return 0.5
+
+
+ROLLOUT_POLICIES = {"random": RolloutEngine, "pattern": PatternRolloutEngine}
+
+
+@lru_cache(maxsize=None)
+def get_rollout_engine(radius, policy="random"):
+    if policy == "numpy":
+        # diimpor di sini karena numpy opsional
+        from agents.batch_rollout import BatchRolloutEngine
+        return BatchRolloutEngine(radius)
+    return ROLLOUT_POLICIES[policy](radius)
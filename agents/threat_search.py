@@ -0,0 +1,165 @@
+import time
+
+from agents.bitboard import PLAYER_X, PLAYER_O, index_cell, iter_indices
+from agents.threats import five_moves, four_moves, open_three_moves
+
+DEFAULT_MAX_NODES = 2000
+DEFAULT_TIME_MS = 250
+VCF_DEPTH = 12      # jumlah langkah penyerang maksimum
+VCT_DEPTH = 6
+
+
+class _BudgetExceeded(Exception):
+    pass
+
+
+def _single(mask):
+    # True jika mask berisi tepat satu bit
+    return mask and not mask & (mask - 1)
+
+
+# ==============================
+# THREAT-SPACE SOLVER
+# ==============================
+class ThreatSolver:
+    """Pencarian menang paksa yang hanya memakai langkah ancaman.
+
+    VCF (victory by continuous fours): penyerang hanya memainkan four, jadi
+    balasan lawan selalu tunggal. VCT (victory by continuous threats):
+    penyerang juga boleh memainkan open three; semua pertahanan lawan yang
+    masuk akal (menutup four yang bisa terbentuk, atau four balasan) dicoba.
+    Pencarian dihentikan saat batas node atau waktu tercapai.
+    """
+
+    def __init__(self, max_nodes=DEFAULT_MAX_NODES, time_ms=DEFAULT_TIME_MS):
+        self.max_nodes = max_nodes
+        self.deadline = time.perf_counter() + time_ms / 1000.0 if time_ms else None
+        self.nodes = 0
+        self._cache = {}
+
+    def _tick(self):
+        self.nodes += 1
+        if self.nodes > self.max_nodes:
+            raise _BudgetExceeded()
+        if self.deadline is not None and not self.nodes % 64 and time.perf_counter() > self.deadline:
+            raise _BudgetExceeded()
+
+    def solve(self, board, attacker, vct=True):
+        """Langkah pertama dari menang paksa bagi `attacker`, atau None jika tidak terbukti."""
+        board = board.copy()
+        try:
+            move = self._vcf(board, attacker, VCF_DEPTH)
+            if move is None and vct:
+                move = self._vct(board, attacker, VCT_DEPTH)
+        except _BudgetExceeded:
+            return None
+        return move
+
+    # --- VCF ---
+    def _vcf(self, board, attacker, depth):
+        self._tick()
+        defender = PLAYER_X if attacker == PLAYER_O else PLAYER_O
+        empty = board.empty
+        own_fives = five_moves(board.bits(attacker), empty)
+        if own_fives:
+            return index_cell(own_fives.bit_length() - 1)
+        if depth == 0:
+            return None
+
+        opp_fives = five_moves(board.bits(defender), empty)
+        if opp_fives and not _single(opp_fives):
+            return None
+        candidates = four_moves(board.bits(attacker), empty)
+        if opp_fives:
+            candidates &= opp_fives
+
+        for idx in iter_indices(candidates):
+            r, c = index_cell(idx)
+            board.place(r, c, attacker)
+            win = self._after_four(board, attacker, defender, depth, self._vcf)
+            board.remove(r, c)
+            if win:
+                return (r, c)
+        return None
+
+    def _after_four(self, board, attacker, defender, depth, search):
+        # Penyerang baru saja membuat four: lawan wajib menutup (kecuali double four)
+        threats = five_moves(board.bits(attacker), board.empty)
+        if not _single(threats):
+            return True
+        br, bc = index_cell(threats.bit_length() - 1)
+        board.place(br, bc, defender)
+        win = search(board, attacker, depth - 1) is not None
+        board.remove(br, bc)
+        return win
+
+    # --- VCT ---
+    def _vct(self, board, attacker, depth):
+        key = (board.key, attacker, depth)
+        if key in self._cache:
+            return self._cache[key]
+        result = self._vct_search(board, attacker, depth)
+        self._cache[key] = result
+        return result
+
+    def _vct_search(self, board, attacker, depth):
+        self._tick()
+        defender = PLAYER_X if attacker == PLAYER_O else PLAYER_O
+        empty = board.empty
+        own = board.bits(attacker)
+        own_fives = five_moves(own, empty)
+        if own_fives:
+            return index_cell(own_fives.bit_length() - 1)
+        if depth == 0:
+            return None
+
+        opp_fives = five_moves(board.bits(defender), empty)
+        if opp_fives and not _single(opp_fives):
+            return None
+        fours = four_moves(own, empty)
+        threes = open_three_moves(own, empty) & ~fours
+        if opp_fives:
+            fours &= opp_fives
+            threes &= opp_fives
+
+        for idx in iter_indices(fours):
+            r, c = index_cell(idx)
+            board.place(r, c, attacker)
+            win = self._after_four(board, attacker, defender, depth, self._vct)
+            board.remove(r, c)
+            if win:
+                return (r, c)
+
+        for idx in iter_indices(threes):
+            r, c = index_cell(idx)
+            board.place(r, c, attacker)
+            win = self._after_three(board, attacker, defender, depth)
+            board.remove(r, c)
+            if win:
+                return (r, c)
+        return None
+
+    def _after_three(self, board, attacker, defender, depth):
+        # Lawan boleh menutup sel mana pun yang akan menjadi four penyerang,
+        # atau membalas dengan four sendiri; penyerang harus menang di semua cabang.
+        empty = board.empty
+        if five_moves(board.bits(defender), empty):
+            return False
+        defences = four_moves(board.bits(attacker), empty) | four_moves(board.bits(defender), empty)
+        if not defences:
+            return False
+        for idx in iter_indices(defences):
+            r, c = index_cell(idx)
+            board.place(r, c, defender)
+            win = self._vct(board, attacker, depth - 1) is not None
+            board.remove(r, c)
+            if not win:
+                return False
+        return True
+
+
+def find_forced_win(board, attacker, max_nodes=DEFAULT_MAX_NODES, time_ms=DEFAULT_TIME_MS, vct=True):
+    """Cari VCF lalu VCT untuk `attacker` dalam batas node/waktu; kembalikan langkah atau None."""
+    if max_nodes <= 0:
+        return None
+    return ThreatSolver(max_nodes, time_ms).solve(board, attacker, vct)
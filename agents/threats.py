@@ -0,0 +1,65 @@
+from itertools import combinations
+
+from agents.bitboard import SHIFTS
+
+# ==============================
+# THREAT MASKS
+# ==============================
+# Semua fungsi menerima bitboard bidak sendiri (`own`) dan sel kosong (`empty`)
+# lalu mengembalikan mask sel kosong yang menghasilkan ancaman tertentu. Window
+# yang melewati kolom penjaga otomatis gugur karena bit penjaga selalu 0.
+
+_FIVE_GAPS = tuple(range(5))
+_FOUR_GAPS = tuple(combinations(range(5), 2))
+_THREE_GAPS = tuple(combinations(range(1, 5), 2))
+
+
+def five_moves(own, empty):
+    """Sel yang langsung membuat lima (atau lebih) berderet."""
+    mask = 0
+    for s in SHIFTS:
+        own_at = [own >> (i * s) for i in range(5)]
+        empty_at = [empty >> (i * s) for i in range(5)]
+        for gap in _FIVE_GAPS:
+            w = empty_at[gap]
+            for i in range(5):
+                if i != gap:
+                    w &= own_at[i]
+            if w:
+                mask |= w << (gap * s)
+    return mask
+
+
+def four_moves(own, empty):
+    """Sel yang membuat four: window 5 sel berisi 4 bidak sendiri + 1 kosong."""
+    mask = 0
+    for s in SHIFTS:
+        own_at = [own >> (i * s) for i in range(5)]
+        empty_at = [empty >> (i * s) for i in range(5)]
+        for a, b in _FOUR_GAPS:
+            w = empty_at[a] & empty_at[b]
+            for i in range(5):
+                if i != a and i != b:
+                    w &= own_at[i]
+            if w:
+                mask |= (w << (a * s)) | (w << (b * s))
+    return mask
+
+
+def open_three_moves(own, empty):
+    """Sel yang membuat open three: window 6 sel _XXX_ (dengan satu lubang boleh)."""
+    mask = 0
+    for s in SHIFTS:
+        own_at = [own >> (i * s) for i in range(6)]
+        empty_at = [empty >> (i * s) for i in range(6)]
+        ends = empty_at[0] & empty_at[5]
+        if not ends:
+            continue
+        for a, b in _THREE_GAPS:
+            w = ends & empty_at[a] & empty_at[b]
+            for i in range(1, 5):
+                if i != a and i != b:
+                    w &= own_at[i]
+            if w:
+                mask |= (w << (a * s)) | (w << (b * s))
+    return mask
@@ -0,0 +1,74 @@
+EXACT = 0
+LOWER = 1   # skor >= nilai tersimpan (fail-high)
+UPPER = 2   # skor <= nilai tersimpan (fail-low)
+
+
+# ==============================
+# TRANSPOSITION TABLE
+# ==============================
+class TranspositionTable:
+    """Tabel hash ukuran tetap (2^size_bits slot) yang diindeks dengan Zobrist key.
+
+    Setiap slot menyimpan tuple (key, depth, flag, score, best_move, age).
+    Kebijakan penggantian: entri dari pencarian lama (age berbeda) selalu
+    boleh ditimpa; dalam pencarian yang sama, entri hanya ditimpa oleh
+    hasil dengan depth yang sama/lebih dalam. Untuk posisi yang sama, entri
+    yang lebih dalam selalu dipertahankan, dan best_move lama dipakai jika
+    hasil baru tidak punya.
+    """
+
+    def __init__(self, size_bits=18):
+        self.size = 1 << size_bits
+        self._index_mask = self.size - 1
+        self.entries = [None] * self.size
+        self.age = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.overwrites = 0
+        self.rejected = 0
+
+    def new_search(self):
+        self.age += 1
+
+    def clear(self):
+        self.entries = [None] * self.size
+        self.age = 0
+        self.hits = self.misses = self.stores = self.overwrites = self.rejected = 0
+
+    def probe(self, key):
+        entry = self.entries[key & self._index_mask]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def store(self, key, depth, flag, score, best_move):
+        slot = key & self._index_mask
+        old = self.entries[slot]
+        if old is not None and old[0] == key:
+            # Posisi yang sama: hasil yang lebih dangkal tidak menggantikan yang lebih dalam
+            if old[1] > depth:
+                self.rejected += 1
+                return
+            if best_move is None:
+                best_move = old[4]
+        elif old is not None:
+            if old[5] == self.age and old[1] > depth:
+                self.rejected += 1
+                return
+            self.overwrites += 1
+        self.entries[slot] = (key, depth, flag, score, best_move, self.age)
+        self.stores += 1
+
+    def stats(self):
+        probes = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / probes if probes else 0.0,
+            "stores": self.stores,
+            "overwrites": self.overwrites,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,52 @@
+from agents.bitboard import BOARD_SIZE, EMPTY, PLAYER_X, PLAYER_O, BitBoard
+
+
+class GameState:
+    """State satu permainan yang di-update secara inkremental per langkah.
+
+    Menyimpan papan (BitBoard untuk agent, list 2D untuk digambar), giliran,
+    jumlah langkah, langkah terakhir dan pemenang. Cek menang hanya melihat
+    garis yang melewati bidak terakhir, dan seri cukup dari jumlah langkah.
+    """
+
+    def __init__(self):
+        self.board = BitBoard()
+        self.grid = [[EMPTY for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+        self.current_player = PLAYER_X
+        self.move_count = 0
+        self.last_move = None
+        self.winner = None  # None = berjalan, 0 = seri, PLAYER_X / PLAYER_O = menang
+
+    @property
+    def game_over(self):
+        return self.winner is not None
+
+    def is_legal(self, move):
+        if move is None:
+            return False
+        x, y = move
+        return 0 <= x < BOARD_SIZE and 0 <= y < BOARD_SIZE and self.grid[x][y] == EMPTY
+
+    def play(self, move):
+        """Pasang bidak pemain yang sedang jalan. False jika langkah tidak sah."""
+        if self.game_over or not self.is_legal(move):
+            return False
+        x, y = move
+        player = self.current_player
+        self.board.place(x, y, player)
+        self.grid[x][y] = player
+        self.move_count += 1
+        self.last_move = move
+
+        if self.board.wins_at(x, y, player):
+            self.winner = player
+        elif self.move_count == BOARD_SIZE * BOARD_SIZE:
+            self.winner = 0
+        else:
+            self.current_player = PLAYER_O if player == PLAYER_X else PLAYER_X
+        return True
+
+    def forfeit(self):
+        """Pemain yang sedang jalan kalah (mis. agent memberi langkah tidak sah)."""
+        self.winner = PLAYER_O if self.current_player == PLAYER_X else PLAYER_X
+        return self.winner
@@ -8,6 +8,7 @@ import subprocess
 from datetime import datetime
 from agents.minimax_optimized_agent import get_move_minimax_level
 from agents.mcts_optimized_agent import get_move_mcts
+from game_state import GameState
 from gomoku_simulasi import play_single_game, save_simulation_result, describe_agent as sim_describe_agent
 
 # ==============================
@@ -172,9 +173,6 @@ class InputField:
 # BOARD
 # ==============================
 
-def create_board():
-    return [[EMPTY for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
-
 def draw_board(board, label_x, label_o, title_text):
     screen.fill(BG_COLOR)
 
@@ -215,37 +213,6 @@ def draw_board(board, label_x, label_o, title_text):
 
     pygame.display.flip()
 
-# ==============================
-# LOGIC
-# ==============================
-def check_winner(board, player):
-    dirs = [(1,0),(0,1),(1,1),(1,-1)]
-    for x in range(BOARD_SIZE):
-        for y in range(BOARD_SIZE):
-            if board[x][y] == player:
-                for dx, dy in dirs:
-                    cnt = 1
-                    nx, ny = x+dx, y+dy
-                    while 0 <= nx < BOARD_SIZE and 0 <= ny < BOARD_SIZE and board[nx][ny] == player:
-                        cnt += 1
-                        if cnt == 5:
-                            return True
-                        nx += dx
-                        ny += dy
-    return False
-
-def is_full(board):
-    return all(cell != EMPTY for row in board for cell in row)
-
-def apply_move(board, move, player):
-    if move is None:
-        return False
-    x, y = move
-    if 0 <= x < BOARD_SIZE and 0 <= y < BOARD_SIZE and board[x][y] == EMPTY:
-        board[x][y] = player
-        return True
-    return False
-
 # ==============================
 # END
 # ==============================
@@ -442,10 +409,7 @@ def main():
     player_o_level = None
     
     # Game variables
-    board = None
-    current_player = PLAYER_X
-    game_over = False
-    winner = None
+    game = None
     
     # Simulation variables
     sim_num_games = 10
@@ -567,10 +531,7 @@ def main():
                 
                 if confirm_button.handle_event(event) and player_o_agent and player_o_level is not None:
                     # Start game
-                    board = create_board()
-                    current_player = PLAYER_X
-                    game_over = False
-                    winner = None
+                    game = GameState()
                     game_state = STATE_GAME
                 
                 if back_button.handle_event(event):
@@ -654,11 +615,11 @@ def main():
             elif game_state == STATE_GAME:
                 if back_button.handle_event(event):
                     game_state = STATE_MENU
-                    board = None
+                    game = None
                     continue
                 
                 # Human player input
-                if not game_over and current_player == PLAYER_X and player_x_agent == "human":
+                if not game.game_over and game.current_player == PLAYER_X and player_x_agent == "human":
                     if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                         mx, my = event.pos
                         # Check if click is on board
@@ -667,15 +628,7 @@ def main():
                             grid_y = round((mx - BOARD_X) / CELL_SIZE)
                             
                             if 0 <= grid_x < BOARD_SIZE and 0 <= grid_y < BOARD_SIZE:
-                                if apply_move(board, (grid_x, grid_y), PLAYER_X):
-                                    if check_winner(board, PLAYER_X):
-                                        winner = PLAYER_X
-                                        game_over = True
-                                    elif is_full(board):
-                                        winner = 0
-                                        game_over = True
-                                    else:
-                                        current_player = PLAYER_O
+                                game.play((grid_x, grid_y))
         
         # === RENDER ===
         if game_state == STATE_MENU:
@@ -851,40 +804,24 @@ def main():
                 else "Agent (O)"
             )
 
-            draw_board(board, label_x, label_o, "")
+            draw_board(game.grid, label_x, label_o, "")
 
             back_button.draw(screen)
             
             # AI moves
-            if not game_over:
-                if current_player == PLAYER_X and player_x_agent != "human":
-                    move = get_move_for_agent(board, player_x_agent, player_x_level)
-                    if apply_move(board, move, PLAYER_X):
-                        if check_winner(board, PLAYER_X):
-                            winner = PLAYER_X
-                            game_over = True
-                        elif is_full(board):
-                            winner = 0
-                            game_over = True
-                        else:
-                            current_player = PLAYER_O
+            if not game.game_over:
+                if game.current_player == PLAYER_X and player_x_agent != "human":
+                    move = get_move_for_agent(game.board, player_x_agent, player_x_level)
+                    game.play(move)
                     pygame.time.wait(300)
                 
-                elif current_player == PLAYER_O:
-                    move = get_move_for_agent(board, player_o_agent, player_o_level)
-                    if apply_move(board, move, PLAYER_O):
-                        if check_winner(board, PLAYER_O):
-                            winner = PLAYER_O
-                            game_over = True
-                        elif is_full(board):
-                            winner = 0
-                            game_over = True
-                        else:
-                            current_player = PLAYER_X
+                elif game.current_player == PLAYER_O:
+                    move = get_move_for_agent(game.board, player_o_agent, player_o_level)
+                    game.play(move)
                     pygame.time.wait(300)
             
-            if game_over:
-                show_end_message(winner, label_x, label_o)
+            if game.game_over:
+                show_end_message(game.winner, label_x, label_o)
                 pygame.time.wait(2000)
                 game_state = STATE_MENU
         
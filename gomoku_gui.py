@@ -1,21 +1,9 @@
 import pygame
 import sys
-import json
-import os
+from agents.config_registry import get_gui_config
 from agents.minimax_optimized_agent import get_move_minimax_level
 from agents.mcts_optimized_agent import get_move_mcts
-
-def load_gui_config():
-    config_path = os.path.join(
-        os.path.dirname(__file__),
-        "agents",
-        "config",
-        "gui_config.json"
-    )
-    with open(config_path, "r") as f:
-        return json.load(f)
-
-GUI_CONFIG = load_gui_config()
+from game_state import GameState
 
 
 # ==============================
@@ -65,9 +53,6 @@ winner_font = pygame.font.Font(None, int(CELL_SIZE * 1.8))
 # ==============================
 # BOARD
 # ==============================
-def create_board():
-    return [[EMPTY for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
-
 def draw_board(board, label_x, label_o, title_text):
     screen.fill(BG_COLOR)
 
@@ -99,37 +84,6 @@ def draw_board(board, label_x, label_o, title_text):
 
     pygame.display.flip()
 
-# ==============================
-# LOGIC
-# ==============================
-def check_winner(board, player):
-    dirs = [(1,0),(0,1),(1,1),(1,-1)]
-    for x in range(BOARD_SIZE):
-        for y in range(BOARD_SIZE):
-            if board[x][y] == player:
-                for dx, dy in dirs:
-                    cnt = 1
-                    nx, ny = x+dx, y+dy
-                    while 0 <= nx < BOARD_SIZE and 0 <= ny < BOARD_SIZE and board[nx][ny] == player:
-                        cnt += 1
-                        if cnt == 5:
-                            return True
-                        nx += dx
-                        ny += dy
-    return False
-
-def is_full(board):
-    return all(cell != EMPTY for row in board for cell in row)
-
-def apply_move(board, move, player):
-    if move is None:
-        return False
-    x, y = move
-    if 0 <= x < BOARD_SIZE and 0 <= y < BOARD_SIZE and board[x][y] == EMPTY:
-        board[x][y] = player
-        return True
-    return False
-
 # ==============================
 # END
 # ==============================
@@ -177,62 +131,35 @@ def get_move_for_agent(board, conf):
 
 
 def main():
-    conf_x = GUI_CONFIG["player_x"]
-    conf_o = GUI_CONFIG["player_o"]
+    gui_config = get_gui_config()
+    conf_x = gui_config["player_x"]
+    conf_o = gui_config["player_o"]
 
     label_x = f"{describe_agent(conf_x)} (X)"
     label_o = f"{describe_agent(conf_o)} (O)"
     title_text = f"{describe_agent(conf_x)} vs {describe_agent(conf_o)}"
 
-    board = create_board()
-    current_player = PLAYER_X
-    game_over = False
-    winner = None
+    game = GameState()
     clock = pygame.time.Clock()
 
-    while not game_over:
+    while not game.game_over:
         clock.tick(60)
-        draw_board(board, label_x, label_o, title_text)
+        draw_board(game.grid, label_x, label_o, title_text)
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
 
-        if current_player == PLAYER_X:
-            move = get_move_for_agent(board, conf_x)
-            if not apply_move(board, move, PLAYER_X):
-                winner = PLAYER_O
-                break
-
-            if check_winner(board, PLAYER_X):
-                winner = PLAYER_X
-                game_over = True
-            elif is_full(board):
-                winner = 0
-                game_over = True
-            else:
-                current_player = PLAYER_O
-
-        else:
-            move = get_move_for_agent(board, conf_o)
-
-            if not apply_move(board, move, PLAYER_O):
-                winner = PLAYER_X
-                break
-
-            if check_winner(board, PLAYER_O):
-                winner = PLAYER_O
-                game_over = True
-            elif is_full(board):
-                winner = 0
-                game_over = True
-            else:
-                current_player = PLAYER_X
+        conf = conf_x if game.current_player == PLAYER_X else conf_o
+        move = get_move_for_agent(game.board, conf)
+        if not game.play(move):
+            game.forfeit()
+            break
 
         pygame.time.wait(300)
 
-    show_end_message(winner, label_x, label_o)
+    show_end_message(game.winner, label_x, label_o)
 
 if __name__ == "__main__":
     main()
@@ -1,9 +1,10 @@
 import time
-import json
 import os
 from datetime import datetime
+from agents.config_registry import get_gui_config
 from agents.minimax_optimized_agent import get_move_minimax_level
 from agents.mcts_optimized_agent import get_move_mcts
+from game_state import GameState
 
 EMPTY = 0
 PLAYER_X = 1
@@ -11,61 +12,6 @@ PLAYER_O = 2
 BOARD_SIZE = 15
 
 
-# --- CONFIG ---
-def load_gui_config():
-    config_path = os.path.join(
-        os.path.dirname(__file__),
-        "agents",
-        "config",
-        "gui_config.json",
-    )
-    with open(config_path, "r") as f:
-        return json.load(f)
-
-
-GUI_CONFIG = load_gui_config()
-
-
-# --- FUNGSI DASAR ---
-def create_board():
-    return [[EMPTY for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
-
-
-def check_winner(board, player):
-    directions = [(1, 0), (0, 1), (1, 1), (1, -1)]
-    for x in range(BOARD_SIZE):
-        for y in range(BOARD_SIZE):
-            if board[x][y] == player:
-                for dx, dy in directions:
-                    count = 1
-                    nx, ny = x + dx, y + dy
-                    while (
-                        0 <= nx < BOARD_SIZE
-                        and 0 <= ny < BOARD_SIZE
-                        and board[nx][ny] == player
-                    ):
-                        count += 1
-                        if count == 5:
-                            return True
-                        nx += dx
-                        ny += dy
-    return False
-
-
-def is_full(board):
-    return all(board[x][y] != EMPTY for x in range(BOARD_SIZE) for y in range(BOARD_SIZE))
-
-
-def apply_move(board, move, player):
-    if move is None:
-        return False
-    x, y = move
-    if 0 <= x < BOARD_SIZE and 0 <= y < BOARD_SIZE and board[x][y] == EMPTY:
-        board[x][y] = player
-        return True
-    return False
-
-
 # --- AGENT HELPERS ---
 def describe_agent(conf):
     agent = conf.get("agent", "minimax")
@@ -89,39 +35,32 @@ def get_move_for_agent(board, conf):
 
 # --- SIMULASI SATU GAME ---
 def play_single_game(conf_x=None, conf_o=None, verbose=False):
-    conf_x = conf_x or GUI_CONFIG["player_x"]
-    conf_o = conf_o or GUI_CONFIG["player_o"]
+    conf_x = conf_x or get_gui_config()["player_x"]
+    conf_o = conf_o or get_gui_config()["player_o"]
 
-    board = create_board()
-    current_player = PLAYER_X
+    game = GameState()
 
-    while True:
-        if current_player == PLAYER_X:
+    while not game.game_over:
+        if game.current_player == PLAYER_X:
             start = time.time()
-            move = get_move_for_agent(board, conf_x)
+            move = get_move_for_agent(game.board, conf_x)
             end = time.time()
             if verbose:
                 print(f"[{describe_agent(conf_x)}] pilih {move} dalam {end - start:.2f}s")
             
-            if not apply_move(board, move, PLAYER_X):
-                return PLAYER_O  # Invalid move, X kalah
+            if not game.play(move):
+                return game.forfeit()  # Invalid move, X kalah
         else:
             start = time.time()
-            move = get_move_for_agent(board, conf_o)
+            move = get_move_for_agent(game.board, conf_o)
             end = time.time()
             if verbose:
                 print(f"[{describe_agent(conf_o)}] pilih {move} dalam {end - start:.2f}s")
             
-            if not apply_move(board, move, PLAYER_O):
-                return PLAYER_X  # Invalid move, O kalah
-
-        if check_winner(board, current_player):
-            return current_player
-
-        if is_full(board):
-            return 0  # draw
+            if not game.play(move):
+                return game.forfeit()  # Invalid move, O kalah
 
-        current_player = PLAYER_O if current_player == PLAYER_X else PLAYER_X
+    return game.winner  # 0 = draw
 
 
 # --- SAVE HASIL SIMULASI ---
@@ -238,9 +177,10 @@ def run_tournament():
 
 
 if __name__ == "__main__":
-    conf_x = GUI_CONFIG["player_x"]
-    conf_o = GUI_CONFIG["player_o"]
-    sim_config = GUI_CONFIG.get("simulation", {"num_games": 1, "verbose": True})
+    gui_config = get_gui_config()
+    conf_x = gui_config["player_x"]
+    conf_o = gui_config["player_o"]
+    sim_config = gui_config.get("simulation", {"num_games": 1, "verbose": True})
     
     num_games = sim_config.get("num_games", 1)
     verbose = sim_config.get("verbose", True)